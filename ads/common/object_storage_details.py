@@ -3,21 +3,29 @@
 # Copyright (c) 2021, 2024 Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
+import asyncio
+import functools
 import json
 import os
 import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from typing import Dict, List
-from urllib.parse import urlparse
+from urllib.parse import quote, urlencode, urlparse
 
 import oci
+import requests
 from ads.common import auth as authutil
 from ads.common import oci_client
+from ads.common.decorator.runtime_dependency import runtime_dependency
 from ads.dataset.progress import TqdmProgressBar
 
 THREAD_POOL_MAX_WORKERS = 10
 
+# The maximum number of in-flight requests for the asyncio based bulk download.
+ASYNC_DOWNLOAD_MAX_CONNECTIONS = 256
+ASYNC_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
 
 class InvalidObjectStoragePath(Exception):  # pragma: no cover
     """Invalid Object Storage Path."""
@@ -257,7 +265,9 @@ class ObjectStorageDetails:
             version_id=path.version,
         )
         local_filepath = os.path.join(target_dir, path.bucket, path.filepath)
-        os.makedirs(os.path.dirname(local_filepath), exist_ok=True)
+        # The file operations run in the default executor,
+        # so that they never block the other downloads in the event loop.
+        loop = asyncio.get_running_loop()
 
         with open(local_filepath, "wb") as _file:
             for chunk in res.data.iter_content(chunk_size=4096):
@@ -294,3 +304,117 @@ class ObjectStorageDetails:
             }
             for future in as_completed(futures):
                 future.result()
+
+    @runtime_dependency(module="yarl", object="URL")
+    @runtime_dependency(module="aiohttp")
+    def bulk_download_from_object_storage_async(
+        self,
+        paths: List["ObjectStorageDetails"],
+        target_dir: str,
+        progress_bar: TqdmProgressBar = None,
+    ):
+        """Downloads the files with object versions set in the paths dict concurrently,
+        using a single thread running an asyncio event loop.
+        This is preferable over `bulk_download_from_object_storage` when downloading
+        a large number of small objects. The `uvloop` event loop is used if installed.
+
+        Parameters
+        ----------
+        paths:
+            Contains a list of OSS paths along with a value of file version id.
+            If version_id is not available, download the latest version.
+        target_dir:
+            Local directory to save the files
+        progress_bar:
+            an instance of the TqdmProgressBar, can update description in the calling progress bar
+
+        Returns
+        -------
+            None
+        """
+        try:
+            import uvloop
+
+            loop = uvloop.new_event_loop()
+        except ImportError:
+            loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(
+                self._bulk_download_async(paths, target_dir, progress_bar)
+            )
+        finally:
+            loop.close()
+
+    async def _bulk_download_async(
+        self,
+        paths: List["ObjectStorageDetails"],
+        target_dir: str,
+        progress_bar: TqdmProgressBar = None,
+    ):
+        """Downloads the objects within a single `aiohttp` session."""
+        semaphore = asyncio.Semaphore(ASYNC_DOWNLOAD_MAX_CONNECTIONS)
+        connector = aiohttp.TCPConnector(
+            limit=ASYNC_DOWNLOAD_MAX_CONNECTIONS, ttl_dns_cache=300
+        )
+        # The objects are saved as stored, e.g. gzip encoded objects are not
+        # decompressed, the same way as with the OCI SDK.
+        async with aiohttp.ClientSession(
+            connector=connector, auto_decompress=False
+        ) as session:
+            await asyncio.gather(
+                *(
+                    self._download_async(
+                        session, semaphore, path, target_dir, progress_bar
+                    )
+                    for path in paths
+                )
+            )
+
+    async def _download_async(
+        self,
+        session: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        path: "ObjectStorageDetails",
+        target_dir: str,
+        progress_bar: TqdmProgressBar = None,
+    ):
+        """Downloads a single object, see `download_from_object_storage`."""
+        url = (
+            f"{self.os_client.base_client.endpoint}/n/{quote(path.namespace, safe='')}"
+            f"/b/{quote(path.bucket, safe='')}/o/{quote(path.filepath, safe='')}"
+        )
+        if path.version:
+            url = f"{url}?{urlencode({'versionId': path.version})}"
+        local_filepath = os.path.join(target_dir, path.bucket, path.filepath)
+        # The file operations run in the default executor,
+        # so that they never block the other downloads in the event loop.
+        loop = asyncio.get_running_loop()
+
+        async with semaphore:
+            if progress_bar:
+                progress_bar.update(
+                    description=f"Copying model artifacts by reference from {path.path} to {target_dir}",
+                    n=0,
+                )
+            # The request is signed right before being sent,
+            # since the signature includes the request date.
+            request = requests.Request("GET", url).prepare()
+            self.os_client.base_client.signer(request)
+            async with session.get(
+                URL(url, encoded=True), headers=dict(request.headers)
+            ) as response:
+                response.raise_for_status()
+                await loop.run_in_executor(
+                    None,
+                    functools.partial(
+                        os.makedirs, os.path.dirname(local_filepath), exist_ok=True
+                    ),
+                )
+                _file = await loop.run_in_executor(None, open, local_filepath, "wb")
+                try:
+                    async for chunk in response.content.iter_chunked(
+                        ASYNC_DOWNLOAD_CHUNK_SIZE
+                    ):
+                        await loop.run_in_executor(None, _file.write, chunk)
+                finally:
+                    await loop.run_in_executor(None, _file.close)
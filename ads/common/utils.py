@@ -20,12 +20,13 @@ import shutil
 import string
 import sys
 import tempfile
+import time
 from datetime import datetime
 from enum import Enum
 from io import DEFAULT_BUFFER_SIZE
 from pathlib import Path
 from textwrap import fill
-from typing import Dict, Optional, Union
+from typing import Dict, Optional, Tuple, Union
 from urllib import request
 from urllib.parse import urlparse
 
@@ -104,6 +105,17 @@ DEFAULT_PARALLEL_PROCESS_COUNT = 9
 
 LOG_LEVELS = ["NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
+# The chunk sizes probed by `copy_file` when `chunk_size="auto"`,
+# paired with the number of bytes to be copied using each of them.
+AUTO_CHUNK_SIZE_PROBES = (
+    (1 << 20, 8 << 20),
+    (4 << 20, 16 << 20),
+    (16 << 20, 64 << 20),
+)
+
+# The chunk sizes chosen by `copy_file`, keyed by the source scheme and host.
+_auto_chunk_sizes = {}
+
 
 class FileOverwriteError(Exception):  # pragma: no cover
     pass
@@ -1284,7 +1296,7 @@ def copy_file(
     uri_dst: str,
     force_overwrite: Optional[bool] = False,
     auth: Optional[Dict] = None,
-    chunk_size: Optional[int] = DEFAULT_BUFFER_SIZE,
+    chunk_size: Optional[Union[int, str]] = DEFAULT_BUFFER_SIZE,
     progressbar_description: Optional[str] = "Copying `{uri_src}` to `{uri_dst}`",
     ignore_if_src_not_exists: Optional[bool] = False,
 ) -> str:
@@ -1306,8 +1318,11 @@ def copy_file(
         The default authentication is set using `ads.set_auth` API. If you need to override the
         default, use the `ads.common.auth.api_keys` or `ads.common.auth.resource_principal` to create appropriate
         authentication signer and kwargs required to instantiate IdentityClient object.
-    chunk_size: (int, optional). Defaults to `DEFAULT_BUFFER_SIZE`
+    chunk_size: (Union[int, str], optional). Defaults to `DEFAULT_BUFFER_SIZE`
         How much data can be copied in one iteration.
+        Set to `"auto"` to pick the chunk size with the best throughput,
+        measured while copying the beginning of the file. The chosen value is
+        reused for the subsequent copies from the same source host.
     progressbar_description: (str, optional). Defaults to `"Copying `{uri_src}` to `{uri_dst}`"`.
         Prefix for the progressbar.
 
@@ -1322,6 +1337,11 @@ def copy_file(
         If a destination file exists and `force_overwrite` set to `False`.
     """
     chunk_size = chunk_size or DEFAULT_BUFFER_SIZE
+    auto_chunk_size_key = None
+    if chunk_size == "auto":
+        parsed_uri_src = urlparse(uri_src)
+        auto_chunk_size_key = (parsed_uri_src.scheme or "file", parsed_uri_src.netloc)
+        chunk_size = _auto_chunk_sizes.get(auto_chunk_size_key, "auto")
 
     if not os.path.basename(uri_dst):
         uri_dst = os.path.join(uri_dst, os.path.basename(uri_src))
@@ -1339,14 +1359,25 @@ def copy_file(
         raise FileNotFoundError(f"The `{uri_src}` not exists.")
 
     file_size = src_file_system.info(uri_src)["size"]
+    dst_path_scheme = urlparse(uri_dst).scheme or "file"
     if not force_overwrite:
-        dst_path_scheme = urlparse(uri_dst).scheme or "file"
         if fsspec.filesystem(dst_path_scheme, **auth).exists(uri_dst):
             raise FileExistsError(
                 f"The `{uri_dst}` exists. Please use a new file name or "
                 "set force_overwrite to True if you wish to overwrite."
             )
 
+    if not urlparse(uri_src).scheme and not urlparse(uri_dst).scheme:
+        _copy_local_file(
+            uri_src,
+            uri_dst,
+            chunk_size=chunk_size if isinstance(chunk_size, int) else DEFAULT_BUFFER_SIZE,
+            progressbar_description=progressbar_description.format(
+                uri_src=uri_src, uri_dst=uri_dst
+            ),
+        )
+        return uri_dst
+
     with fsspec.open(uri_dst, mode="wb", **auth) as fwrite:
         with fsspec.open(uri_src, mode="rb", encoding=None, **auth) as fread:
             with tqdm.wrapattr(
@@ -1359,6 +1390,12 @@ def copy_file(
                 colour="blue",
                 file=sys.stdout,
             ) as ffrom:
+                if chunk_size == "auto":
+                    chunk_size, probed_all = _probe_chunk_size(ffrom, fwrite)
+                    # A file too small for all the probes does not tell
+                    # how the larger chunk sizes perform for this host.
+                    if probed_all:
+                        _auto_chunk_sizes[auto_chunk_size_key] = chunk_size
                 while True:
                     chunk = ffrom.read(chunk_size)
                     if not chunk:
@@ -1368,6 +1405,107 @@ def copy_file(
     return uri_dst
 
 
+def _copy_local_file(
+    src: str,
+    dst: str,
+    chunk_size: int = DEFAULT_BUFFER_SIZE,
+    progressbar_description: Optional[str] = None,
+) -> None:
+    """Copies a local file. Uses `os.copy_file_range` where available, so that
+    the data is copied by the kernel without passing through the user space.
+
+    Parameters
+    ----------
+    src: str
+        The local path of the source file.
+    dst: str
+        The local path of the destination file.
+    chunk_size: (int, optional). Defaults to `DEFAULT_BUFFER_SIZE`.
+        How much data can be copied in one iteration,
+        when `os.copy_file_range` is not available.
+    progressbar_description: (str, optional). Defaults to None.
+        Prefix for the progressbar.
+
+    Returns
+    -------
+    None
+        Nothing.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(dst)), exist_ok=True)
+    # Unbuffered files are used, so that the regular copy can
+    # continue from the offsets left by `os.copy_file_range`.
+    with open(src, "rb", buffering=0) as fsrc, open(
+        dst, "wb", buffering=0
+    ) as fdst, tqdm(
+        desc=progressbar_description,
+        total=os.fstat(fsrc.fileno()).st_size,
+        unit="B",
+        unit_scale=True,
+        unit_divisor=1024,
+        position=0,
+        leave=False,
+        colour="blue",
+        file=sys.stdout,
+    ) as progress_bar:
+        if hasattr(os, "copy_file_range"):
+            remaining = progress_bar.total
+            try:
+                while remaining > 0:
+                    copied = os.copy_file_range(
+                        fsrc.fileno(), fdst.fileno(), remaining
+                    )
+                    if not copied:
+                        break
+                    remaining -= copied
+                    progress_bar.update(copied)
+            except OSError as ex:
+                logger.debug(f"Falling back to the regular file copy. {ex}")
+        while True:
+            chunk = fsrc.read(chunk_size)
+            if not chunk:
+                break
+            fdst.write(chunk)
+            progress_bar.update(len(chunk))
+
+
+def _probe_chunk_size(fread, fwrite) -> Tuple[int, bool]:
+    """Copies the beginning of `fread` to `fwrite` using the chunk sizes from
+    `AUTO_CHUNK_SIZE_PROBES` and returns the one with the highest throughput.
+
+    Parameters
+    ----------
+    fread: file-like object
+        The source file opened for reading.
+    fwrite: file-like object
+        The destination file opened for writing.
+
+    Returns
+    -------
+    Tuple[int, bool]
+        The chunk size with the highest throughput, ties are resolved in favor
+        of the larger chunk size, and whether all the probes ran to completion.
+    """
+    best_chunk_size, best_throughput = AUTO_CHUNK_SIZE_PROBES[0][0], 0
+    for chunk_size, probe_size in AUTO_CHUNK_SIZE_PROBES:
+        copied = 0
+        start = time.perf_counter()
+        while copied < probe_size:
+            chunk = fread.read(chunk_size)
+            if not chunk:
+                break
+            fwrite.write(chunk)
+            copied += len(chunk)
+        elapsed = time.perf_counter() - start
+        if not copied:
+            return best_chunk_size, False
+        throughput = copied / elapsed if elapsed > 0 else math.inf
+        if throughput >= best_throughput:
+            best_chunk_size, best_throughput = chunk_size, throughput
+        if copied < probe_size:
+            return best_chunk_size, False
+    return best_chunk_size, True
+
+
 def remove_file(file_path: str, auth: Optional[Dict] = None) -> None:
     """
     Reoves file.
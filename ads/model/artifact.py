@@ -12,6 +12,7 @@ import shutil
 import tempfile
 import uuid
 import fsspec
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 from ads.common import auth as authutil
 from ads.common import logger, utils
@@ -19,7 +20,7 @@ from ads.common.object_storage_details import ObjectStorageDetails
 from ads.config import CONDA_BUCKET_NAME, CONDA_BUCKET_NS
 from ads.model.runtime.env_info import EnvInfo, InferenceEnvInfo, TrainingEnvInfo
 from ads.model.runtime.runtime_info import RuntimeInfo
-from jinja2 import Environment, PackageLoader
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader
 import warnings
 from ads import __version__
 from datetime import datetime
@@ -30,6 +31,20 @@ SCORE_VERSION = "1.0"
 ADS_VERSION = __version__
 
 
+@lru_cache(maxsize=None)
+def _get_template_env() -> Environment:
+    """Gets the jinja environment for the `score.py` templates.
+    The environment is shared across the artifacts, so that the compiled
+    templates are cached once per process rather than once per artifact.
+    The packaged templates do not change at runtime, hence the auto reload is
+    disabled and the compiled templates are also cached on disk."""
+    return Environment(
+        loader=PackageLoader("ads", "templates"),
+        auto_reload=False,
+        bytecode_cache=FileSystemBytecodeCache(),
+    )
+
+
 class ArtifactNestedFolderError(Exception):  # pragma: no cover
     def __init__(self, folder: str):
         self.folder = folder
@@ -167,7 +182,7 @@ class ModelArtifact:
         self.score = None
         sys.path.insert(0, self.artifact_dir)
         self.model_file_name = model_file_name
-        self._env = Environment(loader=PackageLoader("ads", "templates"))
+        self._env = _get_template_env()
         self.ignore_conda_error = ignore_conda_error
         self.model = None
         self.auth = auth or authutil.default_signer()
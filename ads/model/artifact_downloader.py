@@ -4,18 +4,371 @@
 # Copyright (c) 2022, 2024 Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
+import heapq
+import logging
+import multiprocessing
 import os
 import shutil
-import uuid
+import struct
+import sys
+import tempfile
 from abc import ABC, abstractmethod
-from typing import Dict, Optional
-from zipfile import ZipFile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+from zipfile import BadZipFile, ZipFile, ZipInfo
+
+import fsspec
+from tqdm import tqdm
 
 from ads.common import utils
 from ads.common.utils import extract_region
 from ads.model.service.oci_datascience_model import OCIDataScienceModel
 from ads.common.object_storage_details import ObjectStorageDetails
 
+logger = logging.getLogger(__name__)
+
+# The number of threads used to extract the members of the model artifacts archive.
+EXTRACT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# The environment variable selecting the engine used to download models by reference.
+# Set to `async` to download the objects using an asyncio event loop instead of threads.
+DOWNLOAD_ENGINE_ENV_VAR = "ADS_DOWNLOAD_ENGINE"
+DOWNLOAD_ENGINE_ASYNC = "async"
+
+# The size of the chunks used to copy the extracted data.
+EXTRACT_BUFFER_SIZE = 1 << 20
+
+# The archives compressed better than this ratio are extracted in a process pool,
+# since the extraction of such archives is bound by the decompression.
+PROCESS_EXTRACT_COMPRESSION_RATIO = 0.6
+
+# The minimum uncompressed size of the archive to be extracted in a process pool.
+PROCESS_EXTRACT_MIN_SIZE = 256 << 20
+
+EXTRACT_MODE_THREAD = "thread"
+EXTRACT_MODE_PROCESS = "process"
+
+# The size of the archive tail fetched to find the end of the zip central
+# directory record before the download starts.
+ZIP_TAIL_SIZE = 64 << 10
+
+# The layouts of the zip records locating the central directory.
+ZIP_EOCD = struct.Struct("<4s4H2LH")
+ZIP_EOCD_SIGNATURE = b"PK\x05\x06"
+ZIP64_EOCD_LOCATOR = struct.Struct("<4sLQL")
+ZIP64_EOCD_LOCATOR_SIGNATURE = b"PK\x06\x07"
+ZIP64_EOCD = struct.Struct("<4sQ2H2L4Q")
+ZIP64_EOCD_SIGNATURE = b"PK\x06\x06"
+
+# The size of the chunks used to download the archive when the download
+# is overlapped with the extraction.
+PIPELINE_CHUNK_SIZE = 4 << 20
+
+
+def _member_path(target_dir: str, name: str) -> str:
+    """Builds the local path of the archive member, sanitized the same way as
+    `ZipFile.extract` does it. Absolute paths, drive letters and `..`
+    components are dropped, so that the member stays within `target_dir`."""
+    arcname = name.replace("/", os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    invalid_path_parts = ("", os.path.curdir, os.path.pardir)
+    arcname = os.path.sep.join(
+        part for part in arcname.split(os.path.sep) if part not in invalid_path_parts
+    )
+    return os.path.join(target_dir, arcname)
+
+
+def _extract_file(zip_file: ZipFile, info: ZipInfo, target_dir: str) -> None:
+    """Extracts a single file member. The parent directory must already exist."""
+    with zip_file.open(info) as src, open(
+        _member_path(target_dir, info.filename), "wb"
+    ) as dst:
+        shutil.copyfileobj(src, dst, EXTRACT_BUFFER_SIZE)
+
+
+def _make_dirs(infos: List[ZipInfo], target_dir: str) -> None:
+    """Creates the directory tree of the archive, once per unique directory."""
+    dirs = {os.path.dirname(info.filename) for info in infos if not info.is_dir()} | {
+        info.filename.rstrip("/") for info in infos if info.is_dir()
+    }
+    for dir_name in sorted(dirs, key=len):
+        os.makedirs(_member_path(target_dir, dir_name), exist_ok=True)
+
+
+def _extract_files(args) -> None:
+    """Extracts the file members in a worker process.
+    The `args` is a tuple of the archive path, the member names and the target directory.
+    """
+    zip_file_path, names, target_dir = args
+    with ZipFile(zip_file_path) as zip_file:
+        for name in names:
+            _extract_file(zip_file, zip_file.getinfo(name), target_dir)
+
+
+def _split_by_size(infos: List[ZipInfo], count: int) -> List[List[str]]:
+    """Splits the members into the groups with nearly equal compressed size.
+    The largest members are assigned first, each to the currently smallest group.
+    """
+    groups = [(0, i, []) for i in range(count)]
+    for info in sorted(infos, key=lambda info: info.compress_size, reverse=True):
+        size, i, names = heapq.heappop(groups)
+        names.append(info.filename)
+        heapq.heappush(groups, (size + info.compress_size, i, names))
+    return [names for _, _, names in groups if names]
+
+
+def _extract_mode(infos: List[ZipInfo]) -> str:
+    """Chooses the process pool for the large and highly compressed archives."""
+    file_size = sum(info.file_size for info in infos)
+    compress_size = sum(info.compress_size for info in infos)
+    if (
+        (os.cpu_count() or 1) > 1
+        and len(infos) > 1
+        and file_size >= PROCESS_EXTRACT_MIN_SIZE
+        and compress_size / file_size < PROCESS_EXTRACT_COMPRESSION_RATIO
+    ):
+        return EXTRACT_MODE_PROCESS
+    return EXTRACT_MODE_THREAD
+
+
+def _parallel_extractall(
+    zip_file_path: str, target_dir: str, mode: Optional[str] = None
+) -> None:
+    """Extracts all members of the zip archive into the target directory.
+
+    The directory tree is created upfront, once per unique directory,
+    after which the file members are extracted in a thread pool or,
+    for the highly compressed archives, in a process pool.
+
+    Parameters
+    ----------
+    zip_file_path: str
+        The local path to the zip archive.
+    target_dir: str
+        The directory to extract the archive to.
+    mode: (str, optional). Defaults to None.
+        Either `thread` or `process`. Chosen automatically if not provided.
+
+    Returns
+    -------
+    None
+    """
+    with ZipFile(zip_file_path) as zip_file:
+        infos = zip_file.infolist()
+        _make_dirs(infos, target_dir)
+        file_infos = [info for info in infos if not info.is_dir()]
+        mode = mode or _extract_mode(file_infos)
+
+        if mode == EXTRACT_MODE_PROCESS:
+            try:
+                _process_extractall(zip_file_path, file_infos, target_dir)
+                return
+            except BrokenProcessPool as e:
+                # The workers die at startup e.g. when the calling script has no
+                # `if __name__ == "__main__"` guard, the threads are used instead.
+                logger.debug(
+                    f"Failed to extract the archive in a process pool: {e}. "
+                    "Extracting it in a thread pool."
+                )
+
+        with ThreadPoolExecutor(max_workers=EXTRACT_MAX_WORKERS) as pool:
+            futures = [
+                pool.submit(_extract_file, zip_file, info, target_dir)
+                for info in file_infos
+            ]
+            for future in as_completed(futures):
+                future.result()
+
+
+def _process_extractall(
+    zip_file_path: str, file_infos: List[ZipInfo], target_dir: str
+) -> None:
+    """Extracts the file members in a process pool.
+
+    Raises
+    ------
+    BrokenProcessPool
+        If a worker process terminates abruptly, e.g. fails to start.
+    """
+    # The forkserver avoids copying the memory of the current process into the workers.
+    context = multiprocessing.get_context(
+        "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else None
+    )
+    groups = _split_by_size(file_infos, os.cpu_count() or 1)
+    with ProcessPoolExecutor(
+        max_workers=len(groups) or 1, mp_context=context
+    ) as pool:
+        for future in as_completed(
+            [
+                pool.submit(_extract_files, (zip_file_path, names, target_dir))
+                for names in groups
+            ]
+        ):
+            future.result()
+
+
+def _central_directory_offset(tail: bytes, tail_offset: int) -> Optional[int]:
+    """Finds where the central directory starts, including the zip64 records,
+    using the end of central directory record found in the archive tail.
+
+    Parameters
+    ----------
+    tail: bytes
+        The tail of the archive.
+    tail_offset: int
+        The offset of the tail within the archive.
+
+    Returns
+    -------
+    Optional[int]
+        The offset of the central directory within the archive,
+        or None if the end of central directory record is not found.
+    """
+    pos = tail.rfind(ZIP_EOCD_SIGNATURE)
+    while pos >= 0:
+        if pos + ZIP_EOCD.size <= len(tail):
+            *_, cd_offset, comment_size = ZIP_EOCD.unpack_from(tail, pos)
+            if pos + ZIP_EOCD.size + comment_size == len(tail):
+                break
+        pos = tail.rfind(ZIP_EOCD_SIGNATURE, 0, pos)
+    else:
+        return None
+
+    locator_pos = pos - ZIP64_EOCD_LOCATOR.size
+    if (
+        locator_pos < 0
+        or tail[locator_pos : locator_pos + 4] != ZIP64_EOCD_LOCATOR_SIGNATURE
+    ):
+        return cd_offset
+
+    # The zip64 end of central directory record follows the central directory
+    # and holds its offset, when the offset does not fit the regular record.
+    _, _, zip64_eocd_offset, _ = ZIP64_EOCD_LOCATOR.unpack_from(tail, locator_pos)
+    zip64_eocd_pos = zip64_eocd_offset - tail_offset
+    if zip64_eocd_pos < 0 or zip64_eocd_pos + ZIP64_EOCD.size > len(tail):
+        return None
+    signature, *_, zip64_cd_offset = ZIP64_EOCD.unpack_from(tail, zip64_eocd_pos)
+    if signature != ZIP64_EOCD_SIGNATURE:
+        return None
+    return zip64_cd_offset
+
+
+def _pipelined_download_extractall(
+    uri_src: str,
+    zip_file_path: str,
+    target_dir: str,
+    auth: Optional[Dict] = None,
+    chunk_size: int = PIPELINE_CHUNK_SIZE,
+    on_extract: Optional[Callable[[], None]] = None,
+) -> bool:
+    """Downloads the zip archive and extracts it into the target directory,
+    overlapping the extraction with the download.
+
+    The tail of the archive is fetched first to locate the central directory,
+    which is then fetched as well, so that it can be read before the rest of
+    the archive is downloaded. The archive is then downloaded sequentially,
+    and every member is submitted for the extraction as soon as its data has
+    landed on the local disk.
+
+    Parameters
+    ----------
+    uri_src: str
+        The URI of the zip archive, which can be local path or OCI object storage URI.
+    zip_file_path: str
+        The local path to download the archive to.
+    target_dir: str
+        The directory to extract the archive to.
+    auth: (Dict, optional). Defaults to None.
+        The authentication to access the `uri_src`.
+    chunk_size: (int, optional). Defaults to `PIPELINE_CHUNK_SIZE`.
+        How much data can be downloaded in one iteration.
+    on_extract: (Callable, optional). Defaults to None.
+        Called once the central directory is read, right before the extraction starts.
+
+    Returns
+    -------
+    bool
+        False if the central directory cannot be located or read from the
+        fetched tail of the archive. Nothing is extracted in this case.
+    """
+    auth = auth or {}
+    file_system = fsspec.filesystem(urlparse(uri_src).scheme or "file", **auth)
+    file_size = file_system.info(uri_src)["size"]
+    tail_offset = file_size - min(file_size, ZIP_TAIL_SIZE)
+    tail = file_system.cat_file(uri_src, start=tail_offset, end=file_size)
+    cd_offset = _central_directory_offset(tail, tail_offset)
+
+    with open(zip_file_path, "wb") as fwrite:
+        fwrite.truncate(file_size)
+        if cd_offset is not None and cd_offset < tail_offset:
+            # The central directory does not fit into the tail.
+            fwrite.seek(cd_offset)
+            fwrite.write(
+                file_system.cat_file(uri_src, start=cd_offset, end=tail_offset)
+            )
+        fwrite.seek(tail_offset)
+        fwrite.write(tail)
+    # The archive is read through an unbuffered handle. A buffered reader could
+    # serve the members from the bytes cached before their data has landed.
+    fread_raw = open(zip_file_path, "rb", buffering=0)
+    try:
+        zip_file = ZipFile(fread_raw)
+    except BadZipFile:
+        fread_raw.close()
+        os.remove(zip_file_path)
+        return False
+
+    with fread_raw, zip_file:
+        infos = sorted(zip_file.infolist(), key=lambda info: info.header_offset)
+        _make_dirs(infos, target_dir)
+        # The data of a member ends where the next member or the central directory starts.
+        data_ends = [info.header_offset for info in infos[1:]] + [zip_file.start_dir]
+        pending = deque(
+            (info, data_end)
+            for info, data_end in zip(infos, data_ends)
+            if not info.is_dir()
+        )
+
+        if on_extract:
+            on_extract()
+        with ThreadPoolExecutor(max_workers=EXTRACT_MAX_WORKERS) as pool:
+            futures = []
+            downloaded = 0
+            with open(zip_file_path, "r+b") as fwrite, file_system.open(
+                uri_src, mode="rb"
+            ) as fread, tqdm.wrapattr(
+                fread,
+                "read",
+                desc="Copying model artifacts to the artifact directory",
+                total=file_size,
+                position=0,
+                leave=False,
+                colour="blue",
+                file=sys.stdout,
+            ) as ffrom:
+                while True:
+                    chunk = ffrom.read(chunk_size)
+                    if not chunk:
+                        break
+                    fwrite.write(chunk)
+                    fwrite.flush()
+                    downloaded += len(chunk)
+                    while pending and pending[0][1] <= downloaded:
+                        info, _ = pending.popleft()
+                        futures.append(
+                            pool.submit(_extract_file, zip_file, info, target_dir)
+                        )
+            for info, _ in pending:
+                futures.append(pool.submit(_extract_file, zip_file, info, target_dir))
+            for future in as_completed(futures):
+                future.result()
+    return True
+
 
 class ArtifactDownloader(ABC):
     """The abstract class to download model artifacts."""
@@ -93,23 +446,28 @@ class SmallArtifactDownloader(ArtifactDownloader):
         _, file_extension = os.path.splitext(artifact_name)
         file_extension = file_extension.lower() if file_extension else ".zip"
 
-        file_content = self.dsc_model.get_model_artifact_content()
         self.progress.update("Copying model artifacts to the artifact directory")
 
-        file_name = (
-            "model_description" if file_extension == ".json" else str(uuid.uuid4())
-        )
-        artifact_file_path = os.path.join(
-            self.target_dir, f"{file_name}{file_extension}"
-        )
-        with open(artifact_file_path, "wb") as _file:
-            _file.write(file_content)
+        if file_extension == ".json":
+            artifact_file = open(
+                os.path.join(self.target_dir, f"model_description{file_extension}"),
+                "wb",
+            )
+        else:
+            artifact_file = tempfile.NamedTemporaryFile(
+                dir=self.target_dir, suffix=file_extension, delete=False
+            )
+        artifact_file_path = artifact_file.name
+        try:
+            with artifact_file:
+                self.dsc_model.stream_artifact_to(artifact_file)
 
-        if file_extension == ".zip":
-            self.progress.update("Extracting model artifacts")
-            with ZipFile(artifact_file_path) as _file:
-                _file.extractall(self.target_dir)
-            utils.remove_file(artifact_file_path)
+            if file_extension == ".zip":
+                self.progress.update("Extracting model artifacts")
+                _parallel_extractall(artifact_file_path, self.target_dir)
+        finally:
+            if file_extension == ".zip":
+                os.remove(artifact_file_path)
 
 
 class LargeArtifactDownloader(ArtifactDownloader):
@@ -185,18 +543,34 @@ class LargeArtifactDownloader(ArtifactDownloader):
 
         self.dsc_model.import_model_artifact(bucket_uri=bucket_uri, region=self.region)
         self.progress.update("Copying model artifacts to the artifact directory")
-        zip_file_path = os.path.join(self.target_dir, f"{str(uuid.uuid4())}.zip")
-        zip_file_path = utils.copy_file(
-            uri_src=bucket_uri,
-            uri_dst=zip_file_path,
-            auth=self.auth,
-            progressbar_description="Copying model artifacts to the artifact directory",
-        )
-        self.progress.update("Extracting model artifacts")
-        with ZipFile(zip_file_path) as zip_file:
-            zip_file.extractall(self.target_dir)
-
-        utils.remove_file(zip_file_path)
+        with tempfile.NamedTemporaryFile(
+            dir=self.target_dir, suffix=".zip", delete=False
+        ) as zip_file:
+            zip_file_path = zip_file.name
+        try:
+            pipelined = ObjectStorageDetails.is_oci_path(
+                bucket_uri
+            ) and _pipelined_download_extractall(
+                uri_src=bucket_uri,
+                zip_file_path=zip_file_path,
+                target_dir=self.target_dir,
+                auth=self.auth,
+                on_extract=lambda: self.progress.update("Extracting model artifacts"),
+            )
+            if not pipelined:
+                utils.copy_file(
+                    uri_src=bucket_uri,
+                    uri_dst=zip_file_path,
+                    force_overwrite=True,
+                    auth=self.auth,
+                    chunk_size="auto",
+                    progressbar_description="Copying model artifacts to the artifact directory",
+                )
+                self.progress.update("Extracting model artifacts")
+                _parallel_extractall(zip_file_path, self.target_dir)
+        finally:
+            if os.path.exists(zip_file_path):
+                os.remove(zip_file_path)
         if self.remove_existing_artifact:
             self.progress.update(
                 "Removing temporary artifacts from the Object Storage bucket"
@@ -238,9 +612,17 @@ class LargeArtifactDownloader(ArtifactDownloader):
                 os_details.version = version
                 os_details_list.append(os_details)
             try:
-                ObjectStorageDetails.from_path(
-                    bucket_uri
-                ).bulk_download_from_object_storage(
+                bucket_details = ObjectStorageDetails.from_path(bucket_uri)
+                if (
+                    os.environ.get(DOWNLOAD_ENGINE_ENV_VAR, "").lower()
+                    == DOWNLOAD_ENGINE_ASYNC
+                ):
+                    bulk_download = (
+                        bucket_details.bulk_download_from_object_storage_async
+                    )
+                else:
+                    bulk_download = bucket_details.bulk_download_from_object_storage
+                bulk_download(
                     paths=os_details_list,
                     target_dir=self.target_dir,
                     progress_bar=self.progress,
@@ -5,10 +5,11 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
 import logging
+import shutil
 import time
 from functools import wraps
 from io import BytesIO
-from typing import Callable, Dict, List, Optional
+from typing import BinaryIO, Callable, Dict, List, Optional
 
 import oci.data_science
 from ads.common import utils
@@ -34,6 +35,8 @@ logger = logging.getLogger(__name__)
 
 _REQUEST_INTERVAL_IN_SEC = 3
 
+_ARTIFACT_STREAM_CHUNK_SIZE = 1 << 20
+
 MODEL_NEEDS_TO_BE_SAVED = (
     "Model needs to be saved to the Model Catalog before it can be accessed."
 )
@@ -136,6 +139,8 @@ class OCIDataScienceModel(
         Gets model artifact attachment information.
     def get_model_artifact_content(self) -> BytesIO:
         Gets model artifact content.
+    stream_artifact_to(self, fileobj: BinaryIO) -> None:
+        Streams model artifact content into the file object.
     create_model_artifact(self, bytes_content: BytesIO) -> None:
         Creates model artifact for specified model.
     import_model_artifact(self, bucket_uri: str, region: str = None) -> None:
@@ -303,6 +308,39 @@ class OCIDataScienceModel(
             if ex.status == 404:
                 raise ModelArtifactNotFoundError()
 
+    @check_for_model_id(
+        msg="Model needs to be saved to the Model Catalog before the artifact content can be read."
+    )
+    def stream_artifact_to(self, fileobj: BinaryIO) -> None:
+        """Streams model artifact content into the file object,
+        without loading the whole artifact into memory.
+        Can only be used to the small artifacts, which size is less than 2GB.
+
+        Parameters
+        ----------
+        fileobj: BinaryIO
+            The file object opened for writing in binary mode.
+
+        Returns
+        -------
+        None
+            Nothing.
+
+        Raises
+        ------
+        ModelArtifactNotFoundError
+            If model artifact not found.
+        """
+        try:
+            response = self.client.get_model_artifact_content(model_id=self.id)
+        except ServiceError as ex:
+            if ex.status == 404:
+                raise ModelArtifactNotFoundError()
+            raise
+        raw = response.data.raw
+        raw.decode_content = True
+        shutil.copyfileobj(raw, fileobj, _ARTIFACT_STREAM_CHUNK_SIZE)
+
     @check_for_model_id(
         msg="Model needs to be saved to the Model Catalog before the artifact can be created."
     )
@@ -4,17 +4,20 @@
 # Copyright (c) 2022, 2023 Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
-import copy
+import io
 import json
 import os
+import re
 import shlex
 import shutil
+import tarfile
 import tempfile
 import time
-from distutils import dir_util
-from typing import Dict, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Dict, Tuple, Union
 
-from ads.common.auth import AuthContext, AuthType, create_signer
+from ads.common.auth import AuthContext, AuthType
 from ads.common.oci_client import OCIClientFactory
 from ads.jobs import (
     ContainerRuntime,
@@ -31,11 +34,14 @@ from ads.opctl.backend.base import Backend, RuntimeFactory
 from ads.opctl.config.resolver import ConfigResolver
 from ads.opctl.constants import DEFAULT_IMAGE_SCRIPT_DIR
 from ads.opctl.decorator.common import print_watch_command
-from ads.opctl.distributed.common.cluster_config_helper import (
-    ClusterConfigToJobSpecConverter,
-)
 from ads.opctl.operator.common.const import ENV_OPERATOR_ARGS
-from ads.opctl.operator.common.operator_loader import OperatorInfo, OperatorLoader
+from ads.opctl.utils import SIGNER_CACHE_TTL, get_signer, ttl_lru_cache
+
+if TYPE_CHECKING:
+    from ads.opctl.operator.common.operator_loader import OperatorInfo
+
+# The maximum number of threads used to start the worker job runs.
+WORKER_JOB_RUN_MAX_WORKERS = 32
 
 REQUIRED_FIELDS = [
     "project_id",
@@ -45,6 +51,76 @@ REQUIRED_FIELDS = [
     "shape_name",
 ]
 
+# The runtime types are resolved once, since instantiating a runtime validates its spec.
+_CONTAINER_RUNTIME_TYPE = ContainerRuntime().type
+_SCRIPT_RUNTIME_TYPE = ScriptRuntime().type
+_PYTHON_RUNTIME_TYPE = PythonRuntime().type
+_NOTEBOOK_RUNTIME_TYPE = NotebookRuntime().type
+_GIT_PYTHON_RUNTIME_TYPE = GitPythonRuntime().type
+
+
+# The characters having a special meaning for the shell-like command syntax.
+_SHELL_SPECIAL_CHARS_RE = re.compile(r"[\"'\\$`]")
+
+
+def _split_command(command: str) -> list:
+    """Splits the command into arguments. The plain whitespace separated commands
+    are split natively, `shlex.split` is only used for the commands with quotes,
+    escapes or other special characters."""
+    if _SHELL_SPECIAL_CHARS_RE.search(command):
+        return shlex.split(command)
+    return command.split()
+
+
+@ttl_lru_cache(ttl=SIGNER_CACHE_TTL, maxsize=8)
+def _get_data_science_client(auth_type: str, oci_config: str, oci_profile: str):
+    """Creates the Data Science client, memoized the same way as `get_signer`."""
+    return OCIClientFactory(
+        **get_signer(auth_type, oci_config, oci_profile)
+    ).data_science
+
+
+@lru_cache(maxsize=64)
+def _load_operator_info(operator_type: str) -> "OperatorInfo":
+    """Loads the operator's detailed information, memoized per operator type."""
+    from ads.opctl.operator.common.operator_loader import OperatorLoader
+
+    return OperatorLoader.from_uri(operator_type).load()
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard links the file when possible, falls back to copying otherwise,
+    e.g. when the source and destination are on different devices."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _print_env_vars(env_vars: Dict) -> None:
+    """Prints the environment variables, one per line, with a single write."""
+    if env_vars:
+        print("\n".join(f"\t{k}:{v}" for k, v in env_vars.items()))
+
+
+class _ReentrantAuthContext(AuthContext):
+    """AuthContext that can be entered again while it is active.
+    Only the outermost enter and exit switch the global authentication state."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._depth = 0
+
+    def __enter__(self):
+        if not self._depth:
+            super().__enter__()
+        self._depth += 1
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._depth -= 1
+        if not self._depth:
+            super().__exit__(exc_type, exc_val, exc_tb)
+
 
 class MLJobBackend(Backend):
     def __init__(self, config: Dict) -> None:
@@ -57,14 +133,30 @@ class MLJobBackend(Backend):
             dictionary of configurations
         """
         self.config = config
-        self.oci_auth = create_signer(
-            config["execution"].get("auth"),
-            config["execution"].get("oci_config", None),
-            config["execution"].get("oci_profile", None),
+        exec_config = config["execution"]
+        auth_args = (
+            exec_config.get("auth"),
+            exec_config.get("oci_config", None),
+            exec_config.get("oci_profile", None),
         )
-        self.auth_type = config["execution"].get("auth")
-        self.profile = config["execution"].get("oci_profile", None)
-        self.client = OCIClientFactory(**self.oci_auth).data_science
+        # The signer dict is copied, so that the cached one is never modified.
+        self.oci_auth = dict(get_signer(*auth_args))
+        self.auth_type = exec_config.get("auth")
+        self.profile = exec_config.get("oci_profile", None)
+        self.client = _get_data_science_client(*auth_args)
+
+    @cached_property
+    def _auth_context(self) -> _ReentrantAuthContext:
+        """The backend's authentication context. Callers running several backend
+        operations in a row can enter it once to avoid switching the global
+        authentication state for each of them."""
+        return _ReentrantAuthContext(auth=self.auth_type, profile=self.profile)
+
+    @cached_property
+    def _is_ads_operator(self) -> bool:
+        """Whether the config runs an ADS operator. Resolved once per backend,
+        since the resolver loads the list of the ADS operators."""
+        return ConfigResolver(self.config)._is_ads_operator()
 
     def init(
         self,
@@ -92,39 +184,40 @@ class MLJobBackend(Backend):
             The YAML specification for the given resource if `uri` was not provided.
             `None` otherwise.
         """
-
-        conda_slug = (
-            kwargs.get(
-                "conda_slug", self.config["execution"].get("conda_slug", "conda_slug")
+        exec_config = self.config["execution"]
+        runtime_type = runtime_type or _PYTHON_RUNTIME_TYPE
+
+        # only the arguments of the selected runtime are prepared
+        runtime_kwargs = {}
+        if runtime_type == _CONTAINER_RUNTIME_TYPE:
+            docker_registry = (
+                (self.config.get("infrastructure") or {})
+                .get("docker_registry", "")
+                .rstrip("/")
             )
-            or ""
-        ).lower()
-
-        # if conda slug contains '/' then the assumption is that it is a custom conda pack
-        # the conda prefix needs to be added
-        if "/" in conda_slug:
-            conda_slug = os.path.join(
-                self.config["execution"].get(
-                    "conda_pack_os_prefix", "oci://bucket@namespace/conda_environments"
-                ),
-                conda_slug,
+            image_name = kwargs.get(
+                "image_name", exec_config.get("image", "image:latest")
             )
-
-        RUNTIME_KWARGS_MAP = {
-            ContainerRuntime().type: {
-                "image": (
-                    f"{self.config['infrastructure'].get('docker_registry','').rstrip('/')}"
-                    f"/{kwargs.get('image_name', self.config['execution'].get('image','image:latest'))}"
+            runtime_kwargs["image"] = f"{docker_registry}/{image_name}"
+        elif runtime_type in (_SCRIPT_RUNTIME_TYPE, _PYTHON_RUNTIME_TYPE):
+            conda_slug = (
+                kwargs.get("conda_slug", exec_config.get("conda_slug", "conda_slug"))
+                or ""
+            ).lower()
+
+            # if conda slug contains '/' then the assumption is that it is a custom conda pack
+            # the conda prefix needs to be added
+            if "/" in conda_slug:
+                conda_slug = os.path.join(
+                    exec_config.get(
+                        "conda_pack_os_prefix",
+                        "oci://bucket@namespace/conda_environments",
+                    ),
+                    conda_slug,
                 )
-            },
-            ScriptRuntime().type: {"conda_slug": conda_slug},
-            PythonRuntime().type: {"conda_slug": conda_slug},
-            NotebookRuntime().type: {},
-            GitPythonRuntime().type: {},
-        }
+            runtime_kwargs["conda_slug"] = conda_slug
 
-        runtime_type = runtime_type or PythonRuntime().type
-        with AuthContext(auth=self.auth_type, profile=self.profile):
+        with self._auth_context:
             # define a job
             job = (
                 Job()
@@ -136,7 +229,7 @@ class MLJobBackend(Backend):
                 )
                 .with_runtime(
                     JobRuntimeFactory.get_runtime(key=runtime_type).init(
-                        **{**kwargs, **RUNTIME_KWARGS_MAP[runtime_type]}
+                        **{**kwargs, **runtime_kwargs}
                     )
                 )
             )
@@ -160,7 +253,7 @@ class MLJobBackend(Backend):
         """
         Create Job and Job Run from YAML.
         """
-        with AuthContext(auth=self.auth_type, profile=self.profile):
+        with self._auth_context:
             job = Job.from_dict(self.config)
             job.create()
             job_run = job.run()
@@ -174,21 +267,18 @@ class MLJobBackend(Backend):
         Create Job and Job Run from OCID or cli parameters.
         """
         # TODO Check that this still runs smoothly for distributed
-        with AuthContext(auth=self.auth_type, profile=self.profile):
-            if self.config["execution"].get("ocid", None):
-                job_id = self.config["execution"]["ocid"]
-                run_id = (
-                    Job.from_datascience_job(self.config["execution"]["ocid"]).run().id
-                )
+        with self._auth_context:
+            exec_config = self.config["execution"]
+            if exec_config.get("ocid", None):
+                job_id = exec_config["ocid"]
+                run_id = Job.from_datascience_job(exec_config["ocid"]).run().id
             else:
                 payload = self._create_payload()  # create job with infrastructure
-                src_folder = self.config["execution"].get("source_folder")
-                if self.config["execution"].get("conda_type") and self.config[
-                    "execution"
-                ].get("conda_slug"):
+                src_folder = exec_config.get("source_folder")
+                if exec_config.get("conda_type") and exec_config.get("conda_slug"):
                     # add conda runtime
                     job_id, run_id = self._run_with_conda_pack(payload, src_folder)
-                elif self.config["execution"].get("image"):
+                elif exec_config.get("image"):
                     # add docker image runtime
                     job_id, run_id = self._run_with_image(payload)
                 else:
@@ -203,14 +293,15 @@ class MLJobBackend(Backend):
         """
         Delete Job or Job Run from OCID.
         """
-        if self.config["execution"].get("id"):
-            job_id = self.config["execution"]["id"]
-            with AuthContext(auth=self.auth_type, profile=self.profile):
+        exec_config = self.config["execution"]
+        if exec_config.get("id"):
+            job_id = exec_config["id"]
+            with self._auth_context:
                 Job.from_datascience_job(job_id).delete()
                 print(f"Job {job_id} has been deleted.")
-        elif self.config["execution"].get("run_id"):
-            run_id = self.config["execution"]["run_id"]
-            with AuthContext(auth=self.auth_type, profile=self.profile):
+        elif exec_config.get("run_id"):
+            run_id = exec_config["run_id"]
+            with self._auth_context:
                 DataScienceJobRun.from_ocid(run_id).delete()
                 print(f"Job run {run_id} has been deleted.")
 
@@ -218,17 +309,18 @@ class MLJobBackend(Backend):
         """
         Cancel Job Run from OCID.
         """
-        with AuthContext(auth=self.auth_type, profile=self.profile):
-            wait_for_completion = self.config["execution"].get("wait_for_completion")
-            if self.config["execution"].get("id"):
-                id = self.config["execution"]["id"]
+        with self._auth_context:
+            exec_config = self.config["execution"]
+            wait_for_completion = exec_config.get("wait_for_completion")
+            if exec_config.get("id"):
+                id = exec_config["id"]
                 Job.from_datascience_job(id).cancel(
                     wait_for_completion=wait_for_completion
                 )
                 if wait_for_completion:
                     print(f"All job runs under {id} have been cancelled.")
-            elif self.config["execution"].get("run_id"):
-                run_id = self.config["execution"]["run_id"]
+            elif exec_config.get("run_id"):
+                run_id = exec_config["run_id"]
                 DataScienceJobRun.from_ocid(run_id).cancel(
                     wait_for_completion=wait_for_completion
                 )
@@ -239,10 +331,11 @@ class MLJobBackend(Backend):
         """
         Watch Job Run from OCID.
         """
-        run_id = self.config["execution"]["run_id"]
-        interval = self.config["execution"].get("interval")
-        wait = self.config["execution"].get("wait")
-        with AuthContext(auth=self.auth_type, profile=self.profile):
+        exec_config = self.config["execution"]
+        run_id = exec_config["run_id"]
+        interval = exec_config.get("interval")
+        wait = exec_config.get("wait")
+        with self._auth_context:
             run = DataScienceJobRun.from_ocid(run_id)
             run.watch(interval=interval, wait=wait)
 
@@ -278,22 +371,23 @@ class MLJobBackend(Backend):
         )
 
     def _run_with_conda_pack(self, payload: Job, src_folder: str) -> Tuple[str, str]:
+        exec_config = self.config["execution"]
         payload.with_runtime(
-            ScriptRuntime().with_environment_variable(
-                **self.config["execution"]["env_vars"]
-            )
+            ScriptRuntime().with_environment_variable(**exec_config["env_vars"])
         )
-        if self.config["execution"].get("conda_type") == "service":
-            payload.runtime.with_service_conda(self.config["execution"]["conda_slug"])
+        if exec_config.get("conda_type") == "service":
+            payload.runtime.with_service_conda(exec_config["conda_slug"])
         else:
-            payload.runtime.with_custom_conda(self.config["execution"]["conda_uri"])
+            payload.runtime.with_custom_conda(exec_config["conda_uri"])
 
-        if ConfigResolver(self.config)._is_ads_operator():
+        if self._is_ads_operator:
             with tempfile.TemporaryDirectory() as td:
                 os.makedirs(os.path.join(td, "operators"), exist_ok=True)
-                dir_util.copy_tree(
+                shutil.copytree(
                     src_folder,
                     os.path.join(td, "operators", os.path.basename(src_folder)),
+                    copy_function=_link_or_copy,
+                    dirs_exist_ok=True,
                 )
                 curr_dir = os.path.dirname(os.path.abspath(__file__))
                 shutil.copy(
@@ -304,26 +398,29 @@ class MLJobBackend(Backend):
                     os.path.join(td, "operators"), entrypoint="operators/run.py"
                 )
                 payload.runtime.set_spec(
-                    "args", shlex.split(self.config["execution"]["command"] + " -r")
+                    "args", _split_command(exec_config["command"] + " -r")
                 )
                 job = payload.create()
                 job_id = job.id
                 run_id = job.run().id
         else:
             with tempfile.TemporaryDirectory() as td:
-                dir_util.copy_tree(
-                    src_folder, os.path.join(td, os.path.basename(src_folder))
+                shutil.copytree(
+                    src_folder,
+                    os.path.join(td, os.path.basename(src_folder)),
+                    copy_function=_link_or_copy,
+                    dirs_exist_ok=True,
                 )
                 payload.runtime.with_source(
                     os.path.normpath(os.path.join(td, os.path.basename(src_folder))),
                     entrypoint=os.path.join(
                         os.path.basename(src_folder),
-                        self.config["execution"]["entrypoint"],
+                        exec_config["entrypoint"],
                     ),
                 )
-                if self.config["execution"].get("command"):
+                if exec_config.get("command"):
                     payload.runtime.set_spec(
-                        "args", shlex.split(self.config["execution"]["command"])
+                        "args", _split_command(exec_config["command"])
                     )
                 job = payload.create()
                 job_id = job.id
@@ -331,30 +428,29 @@ class MLJobBackend(Backend):
         return job_id, run_id
 
     def _run_with_image(self, payload: Job) -> Tuple[str, str]:
+        exec_config = self.config["execution"]
         payload.with_runtime(
-            ContainerRuntime().with_environment_variable(
-                **self.config["execution"]["env_vars"]
-            )
+            ContainerRuntime().with_environment_variable(**exec_config["env_vars"])
         )
-        image = self.config["execution"]["image"]
+        image = exec_config["image"]
         if ":" not in image:
             image += ":latest"
         payload.runtime.with_image(image)
         if os.path.basename(image) == image:
             logger.warn("Did you include registry in image name?")
 
-        if ConfigResolver(self.config)._is_ads_operator():
+        if self._is_ads_operator:
             command = f"python {os.path.join(DEFAULT_IMAGE_SCRIPT_DIR, 'operators/run.py')} -r "
         else:
             command = ""
             # running a non-operator image
-            if self.config["execution"].get("entrypoint"):
-                payload.runtime.with_entrypoint(self.config["execution"]["entrypoint"])
+            if exec_config.get("entrypoint"):
+                payload.runtime.with_entrypoint(exec_config["entrypoint"])
 
-        if self.config["execution"].get("command"):
-            command += f"{self.config['execution']['command']}"
+        if exec_config.get("command"):
+            command += f"{exec_config['command']}"
         if len(command) > 0:
-            payload.runtime.with_cmd(",".join(shlex.split(command)))
+            payload.runtime.with_cmd(",".join(_split_command(command)))
 
         job = payload.create()
         job_id = job.id
@@ -378,19 +474,21 @@ class MLJobDistributedBackend(MLJobBackend):
         self.job = None
 
     def prepare_job_config(self, cluster_info):
+        from ads.opctl.distributed.common.cluster_config_helper import (
+            ClusterConfigToJobSpecConverter,
+        )
+
         job_conf_helper = ClusterConfigToJobSpecConverter(cluster_info)
         jobdef_conf = job_conf_helper.job_def_info()
         infrastructure = cluster_info.infrastructure
         if jobdef_conf.get("name"):
             infrastructure["spec"]["displayName"] = jobdef_conf.get("name")
         job = self._create_payload(infrastructure["spec"])
-        envVars = {}
-        envVars.update(
-            cluster_info.cluster.config.envVars
-        )  # Add user provided environment variables
-        envVars.update(
-            jobdef_conf.get("envVars") or {}
-        )  # Update with `OCI__` environment variables
+        # User provided environment variables, overridden by the `OCI__` ones.
+        envVars = {
+            **cluster_info.cluster.config.envVars,
+            **(jobdef_conf.get("envVars") or {}),
+        }
 
         job.with_runtime(ContainerRuntime().with_environment_variable(**envVars))
         job.runtime.with_image(image=jobdef_conf["image"])
@@ -405,7 +503,11 @@ class MLJobDistributedBackend(MLJobBackend):
         worker_jobrun_conf_list = []
         if worker_jobrun_conf:
             for i in range(cluster_info.cluster.worker.replicas):
-                conf = copy.deepcopy(worker_jobrun_conf)
+                # The env vars are the flat dict of strings, the shallow copy is sufficient.
+                conf = {
+                    **worker_jobrun_conf,
+                    "envVars": {**worker_jobrun_conf["envVars"]},
+                }
                 conf["envVars"]["RANK"] = str(i + 1)
                 conf["name"] = (
                     conf.get("name", worker_jobrun_conf["envVars"]["OCI__MODE"])
@@ -417,7 +519,7 @@ class MLJobDistributedBackend(MLJobBackend):
         ps_jobrun_conf_list = []
         if ps_jobrun_conf:
             for i in range(cluster_info.cluster.ps.replicas):
-                conf = copy.deepcopy(ps_jobrun_conf)
+                conf = {**ps_jobrun_conf, "envVars": {**ps_jobrun_conf["envVars"]}}
                 conf["name"] = (
                     conf.get("name", worker_jobrun_conf["envVars"]["OCI__MODE"])
                     + "_"
@@ -433,7 +535,7 @@ class MLJobDistributedBackend(MLJobBackend):
         return f"{worker_jobrun_conf['name']}-{i}"
 
     def run_diagnostics(self, cluster_info, dry_run=False, **kwargs):
-        with AuthContext(auth=self.auth_type, profile=self.profile):
+        with self._auth_context:
             main_jobrun_conf, worker_jobrun_conf_list = self.prepare_job_config(
                 cluster_info=cluster_info
             )
@@ -450,8 +552,7 @@ class MLJobDistributedBackend(MLJobBackend):
                 print(f"Name: {main_jobrun_conf['name']}")
                 print(f"Additional Environment Variables: ")
                 main_env_Vars = main_jobrun_conf.get("envVars", {})
-                for k in main_env_Vars:
-                    print(f"\t{k}:{main_env_Vars[k]}")
+                _print_env_vars(main_env_Vars)
                 print("~" * 200)
 
                 print(
@@ -478,7 +579,7 @@ class MLJobDistributedBackend(MLJobBackend):
         * The Job Definition will contain all the environment variables defined at the cluster/spec/config level, environment variables defined by the user at runtime/spec/env level and `OCI__` derived from the yaml specification
         * The Job Run will have overrides provided by the user under cluster/spec/{main|worker}/config section and `OCI__MODE`={MASTER|WORKER} depending on the run type
         """
-        with AuthContext(auth=self.auth_type, profile=self.profile):
+        with self._auth_context:
             main_jobrun_conf, worker_jobrun_conf_list = self.prepare_job_config(
                 cluster_info=cluster_info
             )
@@ -495,8 +596,7 @@ class MLJobDistributedBackend(MLJobBackend):
                 print(f"Name: {main_jobrun_conf['name']}")
                 print(f"Additional Environment Variables: ")
                 main_env_Vars = main_jobrun_conf.get("envVars", {})
-                for k in main_env_Vars:
-                    print(f"\t{k}:{main_env_Vars[k]}")
+                _print_env_vars(main_env_Vars)
                 print(
                     "~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~"
                 )
@@ -507,8 +607,7 @@ class MLJobDistributedBackend(MLJobBackend):
                         print("Name: " + worker_jobrun_conf.get("name"))
                         print("Additional Environment Variables: ")
                         worker_env_Vars = worker_jobrun_conf.get("envVars", {})
-                        for k in worker_env_Vars:
-                            print(f"\t{k}:{worker_env_Vars[k]}")
+                        _print_env_vars(worker_env_Vars)
 
                 print(
                     "-----------------------------Ending dryrun mode----------------------------------"
@@ -526,17 +625,23 @@ class MLJobDistributedBackend(MLJobBackend):
                     # freeform_tags={"distributed_training": "oracle-ads"},
                 )
 
-                # Start worker job
+                # Start worker jobs. The job runs are started concurrently,
+                # since each of them is a blocking request to the service.
                 worker_jobruns = []
-                if cluster_info.cluster.worker:
-                    for i in range(len(worker_jobrun_conf_list)):
-                        worker_jobrun_conf = worker_jobrun_conf_list[i]
-                        conf = dict(worker_jobrun_conf)
-                        jobrun = job.run(
-                            worker_jobrun_conf.get("name"),
-                            env_var=conf["envVars"],
+                if cluster_info.cluster.worker and worker_jobrun_conf_list:
+                    with ThreadPoolExecutor(
+                        max_workers=min(
+                            WORKER_JOB_RUN_MAX_WORKERS, len(worker_jobrun_conf_list)
+                        )
+                    ) as pool:
+                        worker_jobruns = list(
+                            pool.map(
+                                lambda conf: job.run(
+                                    conf.get("name"), env_var=conf["envVars"]
+                                ),
+                                worker_jobrun_conf_list,
+                            )
                         )
-                        worker_jobruns.append(jobrun)
                 self.job = job
                 return job, main_jobrun, worker_jobruns
 
@@ -564,7 +669,10 @@ class MLJobOperatorBackend(MLJobBackend):
         The Data Science Job.
     """
 
-    def __init__(self, config: Dict, operator_info: OperatorInfo = None) -> None:
+    # The config sections which are not the part of the operator's specification.
+    _NON_OPERATOR_KEYS = frozenset(("runtime", "infrastructure", "execution"))
+
+    def __init__(self, config: Dict, operator_info: "OperatorInfo" = None) -> None:
         """
         Instantiates the operator backend.
 
@@ -582,23 +690,26 @@ class MLJobOperatorBackend(MLJobBackend):
 
         self.runtime_config = self.config.get("runtime", {})
         self.operator_config = {
-            **{
-                key: value
-                for key, value in self.config.items()
-                if key not in ("runtime", "infrastructure", "execution")
-            }
+            key: value
+            for key, value in self.config.items()
+            if key not in self._NON_OPERATOR_KEYS
         }
         self.operator_type = self.operator_config.get("type", "unknown")
         self.operator_version = self.operator_config.get("version", "unknown")
 
         # registering supported runtime adjusters
         self._RUNTIME_MAP = {
-            ContainerRuntime().type: self._adjust_container_runtime,
-            PythonRuntime().type: self._adjust_python_runtime,
+            _CONTAINER_RUNTIME_TYPE: self._adjust_container_runtime,
+            _PYTHON_RUNTIME_TYPE: self._adjust_python_runtime,
         }
 
         self.operator_info = operator_info
 
+    @cached_property
+    def _operator_config_json(self) -> str:
+        """The operator's config serialized once to be passed to the job as an env variable."""
+        return json.dumps(self.operator_config)
+
     def _adjust_common_information(self):
         """Adjusts common information of the job."""
 
@@ -626,7 +737,7 @@ class MLJobOperatorBackend(MLJobBackend):
             **{
                 "OCI_IAM_TYPE": AuthType.RESOURCE_PRINCIPAL,
                 "OCIFS_IAM_TYPE": AuthType.RESOURCE_PRINCIPAL,
-                ENV_OPERATOR_ARGS: json.dumps(self.operator_config),
+                ENV_OPERATOR_ARGS: self._operator_config_json,
                 **(self.job.runtime.envs or {}),
             }
         )
@@ -635,33 +746,37 @@ class MLJobOperatorBackend(MLJobBackend):
     def _adjust_python_runtime(self):
         """Adjusts python runtime."""
         temp_dir = tempfile.mkdtemp()
-        logger.debug(f"Copying operator's code to the temporary folder: {temp_dir}")
+        # The archive is unpacked into a folder named after the temporary folder,
+        # which is also used as the job's working directory.
+        archive_dir = os.path.basename(temp_dir.rstrip("/"))
+        archive_file = os.path.join(temp_dir, f"{archive_dir}.tar")
+        logger.debug(f"Packing operator's code to the archive: {archive_file}")
 
         # prepare run.sh file to run the operator's code
-        script_file = os.path.join(
-            temp_dir, f"{self.operator_info.type}_{int(time.time())}_run.sh"
-        )
-        with open(script_file, "w") as fp:
-            fp.write(f"python3 -m {self.operator_info.type}")
-
-        # copy the operator's source code to the temporary folder
-        shutil.copytree(
-            self.operator_info.path.rstrip("/"),
-            os.path.join(temp_dir, self.operator_info.type),
-            dirs_exist_ok=True,
-        )
+        script_file = f"{self.operator_info.type}_{int(time.time())}_run.sh"
+        script = f"python3 -m {self.operator_info.type}".encode()
+        script_info = tarfile.TarInfo(os.path.join(archive_dir, script_file))
+        script_info.size = len(script)
+        script_info.mtime = int(time.time())
+        script_info.mode = 0o644
+
+        # add the operator's source code directly to the archive
+        with tarfile.open(archive_file, "w", dereference=True) as tar:
+            tar.addfile(script_info, io.BytesIO(script))
+            tar.add(
+                self.operator_info.path.rstrip("/"),
+                arcname=os.path.join(archive_dir, self.operator_info.type),
+            )
 
         # prepare jobs runtime
         self.job.runtime.with_source(
-            temp_dir,
-            entrypoint=os.path.basename(script_file),
-        ).with_working_dir(
-            os.path.basename(temp_dir.rstrip("/"))
-        ).with_environment_variable(
+            archive_file,
+            entrypoint=script_file,
+        ).with_working_dir(archive_dir).with_environment_variable(
             **{
                 "OCI_IAM_TYPE": AuthType.RESOURCE_PRINCIPAL,
                 "OCIFS_IAM_TYPE": AuthType.RESOURCE_PRINCIPAL,
-                ENV_OPERATOR_ARGS: json.dumps(self.operator_config),
+                ENV_OPERATOR_ARGS: self._operator_config_json,
                 **(self.job.runtime.envs or {}),
             }
         )
@@ -671,8 +786,9 @@ class MLJobOperatorBackend(MLJobBackend):
         """
         Runs the operator on the Data Science Jobs.
         """
-        if not self.operator_info:
-            self.operator_info = OperatorLoader.from_uri(self.operator_type).load()
+        self.operator_info = self.operator_info or _load_operator_info(
+            self.operator_type
+        )
 
         self.job = Job.from_dict(self.runtime_config).build()
 
@@ -702,9 +818,9 @@ class JobRuntimeFactory(RuntimeFactory):
     """Job runtime factory."""
 
     _MAP = {
-        ContainerRuntime().type: ContainerRuntime,
-        ScriptRuntime().type: ScriptRuntime,
-        PythonRuntime().type: PythonRuntime,
-        NotebookRuntime().type: NotebookRuntime,
-        GitPythonRuntime().type: GitPythonRuntime,
+        _CONTAINER_RUNTIME_TYPE: ContainerRuntime,
+        _SCRIPT_RUNTIME_TYPE: ScriptRuntime,
+        _PYTHON_RUNTIME_TYPE: PythonRuntime,
+        _NOTEBOOK_RUNTIME_TYPE: NotebookRuntime,
+        _GIT_PYTHON_RUNTIME_TYPE: GitPythonRuntime,
     }
@@ -9,6 +9,15 @@ from ads.opctl.config.merger import ConfigMerger
 from ads.opctl.constants import DEFAULT_MODEL_FOLDER
 
 
+def _is_missing_or_empty_dir(path: str) -> bool:
+    """Checks if the directory does not exist or is empty, with a single scandir call."""
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is None
+    except FileNotFoundError:
+        return True
+
+
 def download_model(**kwargs):
     p = ConfigProcessor().step(ConfigMerger, **kwargs)
     ocid = p.config["execution"]["ocid"]
@@ -21,10 +30,7 @@ def download_model(**kwargs):
     force_overwrite = p.config["execution"].get("force_overwrite", False)
 
     artifact_directory = os.path.join(model_folder, str(ocid))
-    if (
-        not os.path.exists(artifact_directory)
-        or len(os.listdir(artifact_directory)) == 0
-    ) or force_overwrite:
+    if force_overwrite or _is_missing_or_empty_dir(artifact_directory):
         region = p.config["execution"].get("region", None)
         bucket_uri = p.config["execution"].get("bucket_uri", None)
         timeout = p.config["execution"].get("timeout", None)
@@ -68,6 +74,8 @@ def _download_model(
                 bucket_uri=bucket_uri,
             )
     except Exception as e:
-        print(type(e))
+        logger.debug(
+            f"Failed to download the model {ocid}, removing {artifact_directory}: {e}"
+        )
         shutil.rmtree(artifact_directory, ignore_errors=True)
-        raise e
+        raise
@@ -17,6 +17,9 @@ from ads.opctl.operator.lowcode.anomaly.const import OutputColumns
 
 
 class AnomalyData(AbstractData):
+    # the raw data is used to report the inliers and outliers by category
+    _keep_raw_data = True
+
     def __init__(self, spec: AnomalyOperatorSpec):
         super().__init__(spec=spec, name="input_data")
 
@@ -48,13 +51,18 @@ class AnomalyDatasets:
             The anomaly operator spec.
         """
         self._data = AnomalyData(spec)
-        self.data = self._data.get_data_long()
         self.full_data_dict = self._data.get_dict_by_series()
         if spec.validation_data is not None:
             self.valid_data = ValidationData(spec)
             self.X_valid_dict = self.valid_data.X_valid_dict
             self.y_valid_dict = self.valid_data.y_valid_dict
 
+    @property
+    def data(self) -> pd.DataFrame:
+        """The input data in the long format. Built on access, to not keep
+        a second copy of the whole dataset in memory."""
+        return self._data.get_data_long()
+
     # Returns raw data based on the series_id i.e; the merged target_category_column value
     def get_raw_data_by_cat(self, category):
         return self._data.get_raw_data_by_cat(category)
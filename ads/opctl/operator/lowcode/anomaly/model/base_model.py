@@ -4,6 +4,7 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
 import os
+import shutil
 import tempfile
 import time
 from abc import ABC, abstractmethod
@@ -280,13 +281,13 @@ class AnomalyOperatorBaseModel(ABC):
             with rc.ReportCreator("My Report") as report:
                 report.save(rc.Block(*report_sections), report_local_path)
             enable_print()
-            with open(report_local_path) as f1:
+            with open(report_local_path, "rb") as f1:
                 with fsspec.open(
                     os.path.join(unique_output_dir, self.spec.report_file_name),
-                    "w",
+                    "wb",
                     **storage_options,
                 ) as f2:
-                    f2.write(f1.read())
+                    shutil.copyfileobj(f1, f2)
 
         if self.spec.generate_inliers:
             inliers = anomaly_output.get_inliers(self.datasets)
@@ -6,6 +6,7 @@
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 
 from ads.common.decorator.runtime_dependency import runtime_dependency
 
@@ -25,37 +26,42 @@ class OneClassSVMOperatorModel(AnomalyOperatorBaseModel):
         ),
     )
     def _build_model(self) -> AnomalyOutput:
-        from sklearn.svm import OneClassSVM
-
         model_kwargs = self.spec.model_kwargs
         # map the output as per anomaly dataset class, 1: outlier, 0: inlier
         self.outlier_map = {1: 0, -1: 1}
 
         anomaly_output = AnomalyOutput(date_column="index")
 
-        for target, df in self.datasets.full_data_dict.items():
-            model = OneClassSVM(**model_kwargs)
-            model.fit(df)
-            y_pred = np.vectorize(self.outlier_map.get)(
-                model.predict(df)
-            )
+        # the series are independent, so the models are trained in parallel
+        outputs = Parallel(n_jobs=-1, require="sharedmem")(
+            delayed(self._train_model)(target, df, model_kwargs)
+            for target, df in self.datasets.full_data_dict.items()
+        )
+        for target, anomaly, score in outputs:
+            anomaly_output.add_output(target, anomaly, score)
 
-            scores = model.score_samples(
-                df
-            )
+        return anomaly_output
 
-            index_col = df.columns[0]
+    def _train_model(self, target, df, model_kwargs):
+        """Trains the model for a single series and returns its anomalies and scores."""
+        from sklearn.svm import OneClassSVM
 
-            anomaly = pd.DataFrame(
-                {index_col: df[index_col], OutputColumns.ANOMALY_COL: y_pred}
-            ).reset_index(drop=True)
-            score = pd.DataFrame(
-                {"index": df[index_col], OutputColumns.SCORE_COL: scores}
-            ).reset_index(drop=True)
+        model = OneClassSVM(**model_kwargs)
+        model.fit(df)
+        y_pred = np.vectorize(self.outlier_map.get)(model.predict(df))
 
-            anomaly_output.add_output(target, anomaly, score)
-            
-        return anomaly_output
+        scores = model.score_samples(df)
+
+        index_col = df.columns[0]
+
+        anomaly = pd.DataFrame(
+            {index_col: df[index_col], OutputColumns.ANOMALY_COL: y_pred}
+        ).reset_index(drop=True)
+        score = pd.DataFrame(
+            {"index": df[index_col], OutputColumns.SCORE_COL: scores}
+        ).reset_index(drop=True)
+
+        return target, anomaly, score
 
     def _generate_report(self):
         """Generates the report."""
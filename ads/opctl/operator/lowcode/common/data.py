@@ -16,10 +16,18 @@ from ads.opctl.operator.lowcode.common.errors import (
     DataMismatchError,
 )
 from abc import ABC
+import numpy as np
 import pandas as pd
 
 
 class AbstractData(ABC):
+    # Whether the input data is kept as loaded, next to the transformed data.
+    # Only the datasets reporting from the raw data need to hold the second copy.
+    _keep_raw_data = False
+    # The series ids listed for the data object in `_series_ids_source`.
+    _series_ids = None
+    _series_ids_source = None
+
     def __init__(self, spec: dict, name="input_data"):
         self.Transformations = Transformations
         self.data = None
@@ -43,16 +51,18 @@ class AbstractData(ABC):
 
     def get_dict_by_series(self):
         if not self._data_dict:
-            for s_id in self.list_series_ids():
-                try:
-                    self._data_dict[s_id] = self.data.xs(
-                        s_id, level=DataColumns.Series
-                    ).reset_index()
-                except KeyError as ke:
-                    logger.debug(
-                        f"Unable to extract series: {s_id} from data: {self.data}. This may occur due to significant missing data. Error message: {ke.args}"
-                    )
-                    pass
+            # Splits the rows by series in a single vectorized pass:
+            # the row positions are ordered by series and cut at the series boundaries.
+            codes, series_ids = pd.factorize(
+                self.data.index.get_level_values(DataColumns.Series), sort=False
+            )
+            positions = np.argsort(codes, kind="stable")
+            boundaries = np.cumsum(np.bincount(codes))[:-1]
+            data = self.data.droplevel(DataColumns.Series)
+            for s_id, series_positions in zip(
+                series_ids, np.split(positions, boundaries)
+            ):
+                self._data_dict[s_id] = data.take(series_positions).reset_index()
         return self._data_dict
 
     def get_data_for_series(self, series_id):
@@ -67,7 +77,7 @@ class AbstractData(ABC):
     def _load_data(self, data_spec, **kwargs):
         loading_start_time = time.time()
         try:
-            raw_data = load_data(data_spec)
+            raw_data = load_data(data_spec, **kwargs)
         except InvalidParameterError as e:
             e.args = e.args + (f"Invalid Parameter: {self.name}",)
             raise e
@@ -88,8 +98,16 @@ class AbstractData(ABC):
         return data
 
     def load_transform_ingest_data(self, spec):
-        self.raw_data = self._load_data(getattr(spec, self.name))
-        self.data = self._transform_data(spec, self.raw_data)
+        # The datetime column is parsed with the user-provided format
+        # during the transformations, so it is loaded as is.
+        raw_columns = (
+            [spec.datetime_column.name]
+            if spec.datetime_column and spec.datetime_column.format
+            else None
+        )
+        raw_data = self._load_data(getattr(spec, self.name), raw_columns=raw_columns)
+        self.data = self._transform_data(spec, raw_data)
+        self.raw_data = raw_data if self._keep_raw_data else None
         self._ingest_data(spec)
 
     def _ingest_data(self, spec):
@@ -105,7 +123,13 @@ class AbstractData(ABC):
         return self.data.index.get_level_values(0).max()
 
     def list_series_ids(self):
-        return self.data.index.get_level_values(1).unique().tolist()
+        # The ids are listed for every report block and per-series lookup,
+        # so they are computed once for the current data.
+        if self._series_ids_source is not self.data:
+            self._series_ids = self.data.index.get_level_values(1).unique().tolist()
+            self._series_ids_source = self.data
+        # a copy, since callers sort the returned list in place
+        return list(self._series_ids)
 
     def get_num_rows(self):
         return self.data.shape[0]
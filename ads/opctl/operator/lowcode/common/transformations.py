@@ -104,23 +104,25 @@ class Transformations(ABC):
             df[DataColumns.Series] = merge_category_columns(
                 df, self.target_category_columns
             )
-            merged_values = df[DataColumns.Series].unique().tolist()
-            if self.target_category_columns:
-                for value in merged_values:
-                    self._target_category_columns_map[value] = (
-                        df[df[DataColumns.Series] == value][
-                            self.target_category_columns
-                        ]
-                        .drop_duplicates()
-                        .iloc[0]
-                        .to_dict()
-                    )
+            # the first row of every series holds its category values
+            first_rows = df.drop_duplicates(subset=DataColumns.Series)
+            self._target_category_columns_map = dict(
+                zip(
+                    first_rows[DataColumns.Series],
+                    first_rows[self.target_category_columns].to_dict("records"),
+                )
+            )
 
             if self.target_category_columns != [DataColumns.Series]:
                 df = df.drop(self.target_category_columns, axis=1)
         return df
 
     def _format_datetime_col(self, df):
+        if self.dt_column_format is None and pd.api.types.is_datetime64_any_dtype(
+            df[self.dt_column_name]
+        ):
+            # already parsed, e.g. loaded from parquet or formatted before
+            return df
         try:
             df[self.dt_column_name] = pd.to_datetime(
                 df[self.dt_column_name], format=self.dt_column_format
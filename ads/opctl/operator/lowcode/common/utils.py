@@ -5,6 +5,7 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
 import argparse
+import importlib.util
 import logging
 import os
 import shutil
@@ -32,6 +33,9 @@ from ads.opctl.operator.common.operator_config import OutputDirectory
 from ads.common.object_storage_details import ObjectStorageDetails
 from ads.secrets import ADBSecretKeeper
 
+# The multithreaded pyarrow CSV parser is used when pyarrow is installed.
+PYARROW_CSV_ENGINE_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
 
 def call_pandas_fsspec(pd_fn, filename, storage_options, **kwargs):
     if fsspec.utils.get_protocol(filename) == "file":
@@ -46,7 +50,7 @@ def call_pandas_fsspec(pd_fn, filename, storage_options, **kwargs):
     return pd_fn(filename, storage_options=storage_options, **kwargs)
 
 
-def load_data(data_spec, storage_options=None, **kwargs):
+def load_data(data_spec, storage_options=None, raw_columns=None, **kwargs):
     if data_spec is None:
         raise InvalidParameterError(f"No details provided for this data source.")
     filename = data_spec.url
@@ -67,14 +71,29 @@ def load_data(data_spec, storage_options=None, **kwargs):
         if not format:
             _, format = os.path.splitext(filename)
             format = format[1:]
-        if format in ["json", "clipboard", "excel", "csv", "feather", "hdf"]:
-            read_fn = getattr(pd, f"read_{format}")
+        if format in ["csv", "tsv"]:
+            # CSV readers filter columns and rows while parsing,
+            # so the unused part of the file is never loaded into memory
             data = call_pandas_fsspec(
-                read_fn, filename, storage_options=storage_options
+                pd.read_csv,
+                filename,
+                storage_options=storage_options,
+                sep="\t" if format == "tsv" else ",",
+                usecols=columns or None,
+                nrows=limit or None,
+                # the raw columns are kept as strings, e.g. the datetime column
+                # with a user-provided format, which pyarrow would parse itself
+                dtype={col: str for col in raw_columns} if raw_columns else None,
+                # the pyarrow engine does not support `nrows` and parses the
+                # ISO-like dates regardless of the requested dtype
+                engine="pyarrow"
+                if PYARROW_CSV_ENGINE_AVAILABLE and not limit and not raw_columns
+                else None,
             )
-        elif format in ["tsv"]:
+        elif format in ["json", "clipboard", "excel", "feather", "hdf"]:
+            read_fn = getattr(pd, f"read_{format}")
             data = call_pandas_fsspec(
-                pd.read_csv, filename, storage_options=storage_options, sep="\t"
+                read_fn, filename, storage_options=storage_options
             )
         else:
             raise InvalidParameterError(
@@ -123,7 +142,7 @@ def write_data(data, filename, format, storage_options, index=False, **kwargs):
     if not format:
         _, format = os.path.splitext(filename)
         format = format[1:]
-    if format in ["json", "clipboard", "excel", "csv", "feather", "hdf"]:
+    if format in ["json", "clipboard", "excel", "csv", "feather", "hdf", "parquet"]:
         write_fn = getattr(data, f"to_{format}")
         return call_pandas_fsspec(
             write_fn, filename, index=index, storage_options=storage_options, **kwargs
@@ -134,10 +153,18 @@ def write_data(data, filename, format, storage_options, index=False, **kwargs):
 
 
 def merge_category_columns(data, target_category_columns):
-    result = data.apply(
-        lambda x: "__".join([str(x[col]) for col in target_category_columns]), axis=1
+    if data.empty:
+        return pd.Series([], dtype=str)
+    # Iterating over the rows of a single array avoids building a Series for every row.
+    # The array is taken from the whole frame, so the values are upcast to the common
+    # dtype of all columns, the same way as in the row-wise apply, e.g. the integer
+    # ids of a frame with float columns become "1.0".
+    values = data.to_numpy()[:, data.columns.get_indexer(target_category_columns)]
+    return pd.Series(
+        ["__".join(map(str, row)) for row in values],
+        index=data.index,
+        dtype=object,
     )
-    return result if not result.empty else pd.Series([], dtype=str)
 
 
 def merged_category_column_name(target_category_columns: Union[List, None]):
@@ -9,19 +9,17 @@ import os
 import sys
 from typing import Dict, List
 
-import yaml
-
 from ads.opctl import logger
 from ads.opctl.operator.common.const import ENV_OPERATOR_ARGS
 from ads.opctl.operator.common.utils import _parse_input_args
 
 from .operator_config import ForecastOperatorConfig
-from .model.forecast_datasets import ForecastDatasets
 
 
 def operate(operator_config: ForecastOperatorConfig) -> None:
     """Runs the forecasting operator."""
     from .model.factory import ForecastOperatorModelFactory
+    from .model.forecast_datasets import ForecastDatasets
 
     datasets = ForecastDatasets(operator_config)
     ForecastOperatorModelFactory.get_model(
@@ -42,7 +40,8 @@ def verify(spec: Dict, **kwargs: Dict) -> bool:
 def main(raw_args: List[str]):
     """The entry point of the forecasting the operator."""
     args, _ = _parse_input_args(raw_args)
-    if not args.file and not args.spec and not os.environ.get(ENV_OPERATOR_ARGS):
+    operator_spec_str = args.spec or os.environ.get(ENV_OPERATOR_ARGS)
+    if not args.file and not operator_spec_str:
         logger.info(
             "Please specify -f[--file] or -s[--spec] or "
             f"pass operator's arguments via {ENV_OPERATOR_ARGS} environment variable."
@@ -52,21 +51,27 @@ def main(raw_args: List[str]):
     logger.info("-" * 100)
     logger.info(f"{'Running' if not args.verify else 'Verifying'} the operator...")
 
-    # if spec provided as input string, then convert the string into YAML
+    # if spec provided as input string, then use the parsed JSON directly,
+    # otherwise the string is treated as YAML
+    operator_config = None
     yaml_string = ""
-    if args.spec or os.environ.get(ENV_OPERATOR_ARGS):
-        operator_spec_str = args.spec or os.environ.get(ENV_OPERATOR_ARGS)
-        try:
-            yaml_string = yaml.safe_dump(json.loads(operator_spec_str))
-        except json.JSONDecodeError:
-            yaml_string = yaml.safe_dump(yaml.safe_load(operator_spec_str))
-        except:
-            yaml_string = operator_spec_str
-
-    operator_config = ForecastOperatorConfig.from_yaml(
-        uri=args.file,
-        yaml_string=yaml_string,
-    )
+    if operator_spec_str:
+        yaml_string = operator_spec_str
+        # only a JSON object can hold the spec, so YAML is not parsed as JSON first
+        if operator_spec_str.lstrip().startswith("{"):
+            try:
+                operator_config = ForecastOperatorConfig.from_dict(
+                    json.loads(operator_spec_str)
+                )
+            except json.JSONDecodeError:
+                # e.g. a YAML flow mapping
+                pass
+
+    if operator_config is None:
+        operator_config = ForecastOperatorConfig.from_yaml(
+            uri=args.file,
+            yaml_string=yaml_string,
+        )
 
     # run operator
     if args.verify:
@@ -4,6 +4,8 @@
 # Copyright (c) 2023, 2024 Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
+import logging
+
 import pandas as pd
 import numpy as np
 import pmdarima as pm
@@ -102,8 +104,9 @@ class ArimaOperatorModel(ForecastOperatorBaseModel):
                 conf_int, index=yhat.index, columns=["yhat_lower", "yhat_upper"]
             )
             forecast = pd.concat([yhat_clean, conf_int_clean], axis=1)
-            logger.debug(f"-----------------Model {i}----------------------")
-            logger.debug(forecast[["yhat", "yhat_lower", "yhat_upper"]].tail())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"-----------------Model {i}----------------------")
+                logger.debug(forecast[["yhat", "yhat_lower", "yhat_upper"]].tail())
 
             self.forecast_output.populate_series_output(
                 series_id=s_id,
@@ -296,15 +296,26 @@ class AutoMLXOperatorModel(ForecastOperatorBaseModel):
 
     def get_explain_predict_fn(self, series_id):
         selected_model = self.models[series_id]
+        dt_column_name = self.datasets._datetime_column_name
+        target_col = self.original_target_column
+
+        # The horizon does not change between the explainer's calls,
+        # so it is prepared once rather than on every prediction.
+        horizon_data = self.datasets.get_horizon_at_series(series_id)
+        horizon_data = horizon_data.drop(target_col, axis=1)
+        horizon_data[dt_column_name] = seconds_to_datetime(
+            horizon_data[dt_column_name], dt_format=self.spec.datetime_column.format
+        )
+        horizon_data = self.preprocess(horizon_data)
 
         # If training date, use method below. If future date, use forecast!
         def _custom_predict_fn(
             data,
             model=selected_model,
-            dt_column_name=self.datasets._datetime_column_name,
-            target_col=self.original_target_column,
+            dt_column_name=dt_column_name,
+            target_col=target_col,
             last_train_date=self.datasets.historical_data.get_max_time(),
-            horizon_data=self.datasets.get_horizon_at_series(series_id),
+            horizon_data=horizon_data,
         ):
             """
             data: ForecastDatasets.get_data_at_series(s_id)
@@ -314,11 +325,6 @@ class AutoMLXOperatorModel(ForecastOperatorBaseModel):
                 data[dt_column_name], dt_format=self.spec.datetime_column.format
             )
             data = self.preprocess(data)
-            horizon_data = horizon_data.drop(target_col, axis=1)
-            horizon_data[dt_column_name] = seconds_to_datetime(
-                horizon_data[dt_column_name], dt_format=self.spec.datetime_column.format
-            )
-            horizon_data = self.preprocess(horizon_data)
 
             rows = []
             for i in range(data.shape[0]):
@@ -19,6 +19,11 @@ from .forecast_datasets import ForecastDatasets, ForecastOutput
 from ..const import ForecastOutputColumns, SupportedModels
 from ads.opctl.operator.lowcode.forecast.utils import _select_plot_list
 
+try:
+    from yaml import CDumper as _YamlDumper
+except ImportError:
+    from yaml import Dumper as _YamlDumper
+
 AUTOTS_MAX_GENERATION = 10
 AUTOTS_MODELS_TO_VALIDATE = 0.15
 
@@ -255,7 +260,10 @@ class AutoTSOperatorModel(ForecastOperatorBaseModel):
             sec2_text = rc.Heading("AutoTS Model Parameters", level=2)
             try:
                 sec2 = rc.Yaml(
-                    yaml.dump(list(self.models.best_model.T.to_dict().values())[0]),
+                    yaml.dump(
+                        list(self.models.best_model.T.to_dict().values())[0],
+                        Dumper=_YamlDumper,
+                    ),
                 )
 
             except KeyError as ke:
@@ -8,10 +8,12 @@ import fsspec
 import numpy as np
 import os
 import pandas as pd
+import shutil
 import tempfile
 import time
 import traceback
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple
 
 from ads.common.decorator.runtime_dependency import runtime_dependency
@@ -316,7 +318,7 @@ class ForecastOperatorBaseModel(ABC):
             )
 
     def _test_evaluate_metrics(self, elapsed_time=0):
-        total_metrics = pd.DataFrame()
+        metrics_dfs = []
         summary_metrics = pd.DataFrame()
         data = TestData(self.spec)
 
@@ -352,47 +354,51 @@ class ForecastOperatorBaseModel(ABC):
                 y_pred=y_pred,
                 series_id=s_id,
             )
-            total_metrics = pd.concat([total_metrics, metrics_df], axis=1)
+            metrics_dfs.append(metrics_df)
 
+        # the series metrics are concatenated once, rather than growing the frame per series
+        total_metrics = pd.concat(metrics_dfs, axis=1) if metrics_dfs else pd.DataFrame()
         if total_metrics.empty:
             return total_metrics, summary_metrics, data
 
-        summary_metrics = pd.DataFrame(
-            {
-                SupportedMetrics.MEAN_SMAPE: np.mean(
-                    total_metrics.loc[SupportedMetrics.SMAPE]
-                ),
-                SupportedMetrics.MEDIAN_SMAPE: np.median(
-                    total_metrics.loc[SupportedMetrics.SMAPE]
-                ),
-                SupportedMetrics.MEAN_MAPE: np.mean(
-                    total_metrics.loc[SupportedMetrics.MAPE]
-                ),
-                SupportedMetrics.MEDIAN_MAPE: np.median(
-                    total_metrics.loc[SupportedMetrics.MAPE]
-                ),
-                SupportedMetrics.MEAN_RMSE: np.mean(
-                    total_metrics.loc[SupportedMetrics.RMSE]
-                ),
-                SupportedMetrics.MEDIAN_RMSE: np.median(
-                    total_metrics.loc[SupportedMetrics.RMSE]
-                ),
-                SupportedMetrics.MEAN_R2: np.mean(
-                    total_metrics.loc[SupportedMetrics.R2]
-                ),
-                SupportedMetrics.MEDIAN_R2: np.median(
-                    total_metrics.loc[SupportedMetrics.R2]
-                ),
-                SupportedMetrics.MEAN_EXPLAINED_VARIANCE: np.mean(
-                    total_metrics.loc[SupportedMetrics.EXPLAINED_VARIANCE]
-                ),
-                SupportedMetrics.MEDIAN_EXPLAINED_VARIANCE: np.median(
-                    total_metrics.loc[SupportedMetrics.EXPLAINED_VARIANCE]
-                ),
-                SupportedMetrics.ELAPSED_TIME: elapsed_time,
-            },
-            index=["All Targets"],
-        )
+        # the mean and median of every metric are computed in two passes over all series
+        summary_rows = {
+            SupportedMetrics.SMAPE: (
+                SupportedMetrics.MEAN_SMAPE,
+                SupportedMetrics.MEDIAN_SMAPE,
+            ),
+            SupportedMetrics.MAPE: (
+                SupportedMetrics.MEAN_MAPE,
+                SupportedMetrics.MEDIAN_MAPE,
+            ),
+            SupportedMetrics.RMSE: (
+                SupportedMetrics.MEAN_RMSE,
+                SupportedMetrics.MEDIAN_RMSE,
+            ),
+            SupportedMetrics.R2: (
+                SupportedMetrics.MEAN_R2,
+                SupportedMetrics.MEDIAN_R2,
+            ),
+            SupportedMetrics.EXPLAINED_VARIANCE: (
+                SupportedMetrics.MEAN_EXPLAINED_VARIANCE,
+                SupportedMetrics.MEDIAN_EXPLAINED_VARIANCE,
+            ),
+        }
+        summary_values = total_metrics.loc[list(summary_rows)]
+        if summary_values.shape[1] == 1:
+            # with a single series the mean and the median are the series metrics
+            means = medians = summary_values.iloc[:, 0].to_numpy()
+        else:
+            means = summary_values.mean(axis=1).to_numpy()
+            medians = np.median(summary_values.to_numpy(), axis=1)
+        summary = {}
+        for (mean_name, median_name), mean, median in zip(
+            summary_rows.values(), means, medians
+        ):
+            summary[mean_name] = mean
+            summary[median_name] = median
+        summary[SupportedMetrics.ELAPSED_TIME] = elapsed_time
+        summary_metrics = pd.DataFrame(summary, index=["All Targets"])
 
         """Calculates Mean sMAPE, Median sMAPE, Mean MAPE, Median MAPE, Mean wMAPE, Median wMAPE values for each horizon
         if horizon <= 10."""
@@ -450,112 +456,148 @@ class ForecastOperatorBaseModel(ABC):
                 enable_print()
 
                 report_path = os.path.join(unique_output_dir, self.spec.report_filename)
-                with open(report_local_path) as f1:
+                with open(report_local_path, "rb") as f1:
                     with fsspec.open(
                         report_path,
-                        "w",
+                        "wb",
                         **storage_options,
                     ) as f2:
-                        f2.write(f1.read())
-
-        # forecast csv report
-        write_data(
-            data=result_df,
-            filename=os.path.join(unique_output_dir, self.spec.forecast_filename),
-            format="csv",
-            storage_options=storage_options,
-        )
-
-        # metrics csv report
-        if self.spec.generate_metrics:
-            metrics_col_name = (
-                self.original_target_column
-                if self.datasets.has_artificial_series()
-                else "Series 1"
-            )
-            if metrics_df is not None:
-                write_data(
-                    data=metrics_df.reset_index().rename(
-                        {"index": "metrics", "Series 1": metrics_col_name}, axis=1
-                    ),
+                        shutil.copyfileobj(f1, f2)
+
+        # The output files are independent uploads, so they are written
+        # concurrently and all of them are awaited before reporting success.
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            writes = []
+
+            # forecast report
+            writes.append(
+                executor.submit(
+                    write_data,
+                    data=result_df,
                     filename=os.path.join(
-                        unique_output_dir, self.spec.metrics_filename
+                        unique_output_dir, self.spec.forecast_filename
                     ),
-                    format="csv",
+                    format=self.spec.output_format,
                     storage_options=storage_options,
-                    index=False,
-                )
-            else:
-                logger.warn(
-                    f"Attempted to generate the {self.spec.metrics_filename} file with the training metrics, however the training metrics could not be properly generated."
                 )
+            )
 
-            # test_metrics csv report
-            if self.spec.test_data is not None:
-                if test_metrics_df is not None:
-                    write_data(
-                        data=test_metrics_df.reset_index().rename(
-                            {"index": "metrics", "Series 1": metrics_col_name}, axis=1
-                        ),
-                        filename=os.path.join(
-                            unique_output_dir, self.spec.test_metrics_filename
-                        ),
-                        format="csv",
-                        storage_options=storage_options,
-                        index=False,
-                    )
-                else:
-                    logger.warn(
-                        f"Attempted to generate the {self.spec.test_metrics_filename} file with the test metrics, however the test metrics could not be properly generated."
-                    )
-        # explanations csv reports
-        if self.spec.generate_explanations:
-            try:
-                if self.formatted_global_explanation is not None:
-                    write_data(
-                        data=self.formatted_global_explanation,
-                        filename=os.path.join(
-                            unique_output_dir, self.spec.global_explanation_filename
-                        ),
-                        format="csv",
-                        storage_options=storage_options,
-                        index=True,
+            # metrics report
+            if self.spec.generate_metrics:
+                metrics_col_name = (
+                    self.original_target_column
+                    if self.datasets.has_artificial_series()
+                    else "Series 1"
+                )
+                if metrics_df is not None:
+                    writes.append(
+                        executor.submit(
+                            write_data,
+                            data=metrics_df.reset_index().rename(
+                                {"index": "metrics", "Series 1": metrics_col_name},
+                                axis=1,
+                            ),
+                            filename=os.path.join(
+                                unique_output_dir, self.spec.metrics_filename
+                            ),
+                            format=self.spec.output_format,
+                            storage_options=storage_options,
+                            index=False,
+                        )
                     )
                 else:
                     logger.warn(
-                        f"Attempted to generate global explanations for the {self.spec.global_explanation_filename} file, but an issue occured in formatting the explanations."
+                        f"Attempted to generate the {self.spec.metrics_filename} file with the training metrics, however the training metrics could not be properly generated."
                     )
 
-                if self.formatted_local_explanation is not None:
-                    write_data(
-                        data=self.formatted_local_explanation,
-                        filename=os.path.join(
-                            unique_output_dir, self.spec.local_explanation_filename
-                        ),
-                        format="csv",
+                # test_metrics report
+                if self.spec.test_data is not None:
+                    if test_metrics_df is not None:
+                        writes.append(
+                            executor.submit(
+                                write_data,
+                                data=test_metrics_df.reset_index().rename(
+                                    {"index": "metrics", "Series 1": metrics_col_name},
+                                    axis=1,
+                                ),
+                                filename=os.path.join(
+                                    unique_output_dir, self.spec.test_metrics_filename
+                                ),
+                                format=self.spec.output_format,
+                                storage_options=storage_options,
+                                index=False,
+                            )
+                        )
+                    else:
+                        logger.warn(
+                            f"Attempted to generate the {self.spec.test_metrics_filename} file with the test metrics, however the test metrics could not be properly generated."
+                        )
+
+            if self.spec.generate_model_parameters:
+                # model params
+                writes.append(
+                    executor.submit(
+                        write_data,
+                        data=pd.DataFrame.from_dict(self.model_parameters),
+                        filename=os.path.join(unique_output_dir, "model_params.json"),
+                        format="json",
                         storage_options=storage_options,
                         index=True,
+                        indent=4,
                     )
-                else:
+                )
+
+            # explanations reports
+            if self.spec.generate_explanations:
+                try:
+                    explanation_writes = []
+                    if self.formatted_global_explanation is not None:
+                        explanation_writes.append(
+                            executor.submit(
+                                write_data,
+                                data=self.formatted_global_explanation,
+                                filename=os.path.join(
+                                    unique_output_dir,
+                                    self.spec.global_explanation_filename,
+                                ),
+                                format=self.spec.output_format,
+                                storage_options=storage_options,
+                                index=True,
+                            )
+                        )
+                    else:
+                        logger.warn(
+                            f"Attempted to generate global explanations for the {self.spec.global_explanation_filename} file, but an issue occured in formatting the explanations."
+                        )
+
+                    if self.formatted_local_explanation is not None:
+                        explanation_writes.append(
+                            executor.submit(
+                                write_data,
+                                data=self.formatted_local_explanation,
+                                filename=os.path.join(
+                                    unique_output_dir,
+                                    self.spec.local_explanation_filename,
+                                ),
+                                format=self.spec.output_format,
+                                storage_options=storage_options,
+                                index=True,
+                            )
+                        )
+                    else:
+                        logger.warn(
+                            f"Attempted to generate local explanations for the {self.spec.local_explanation_filename} file, but an issue occured in formatting the explanations."
+                        )
+                    for write in explanation_writes:
+                        write.result()
+                except AttributeError as e:
                     logger.warn(
-                        f"Attempted to generate local explanations for the {self.spec.local_explanation_filename} file, but an issue occured in formatting the explanations."
+                        "Unable to generate explanations for this model type or for this dataset."
                     )
-            except AttributeError as e:
-                logger.warn(
-                    "Unable to generate explanations for this model type or for this dataset."
-                )
-                logger.debug(f"Got error: {e.args}")
+                    logger.debug(f"Got error: {e.args}")
 
-        if self.spec.generate_model_parameters:
-            # model params
-            write_data(
-                data=pd.DataFrame.from_dict(self.model_parameters),
-                filename=os.path.join(unique_output_dir, "model_params.json"),
-                format="json",
-                storage_options=storage_options,
-                index=True,
-                indent=4,
-            )
+            for write in writes:
+                write.result()
 
         # model pickle
         if self.spec.generate_model_pickle:
@@ -4,16 +4,12 @@
 # Copyright (c) 2023 Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
+import importlib
+
 from ..const import SupportedModels, AUTO_SELECT
 from ..operator_config import ForecastOperatorConfig
-from .arima import ArimaOperatorModel
-from .automlx import AutoMLXOperatorModel
-from .autots import AutoTSOperatorModel
 from .base_model import ForecastOperatorBaseModel
-from .neuralprophet import NeuralProphetOperatorModel
-from .prophet import ProphetOperatorModel
 from .forecast_datasets import ForecastDatasets
-from .ml_forecast import MLForecastOperatorModel
 from ..model_evaluator import ModelEvaluator
 
 class UnSupportedModelError(Exception):
@@ -29,15 +25,24 @@ class ForecastOperatorModelFactory:
     The factory class helps to instantiate proper model operator based on the model type.
     """
 
+    # The model modules are imported only when the model is requested,
+    # since each of them pulls in its own forecasting framework.
     _MAP = {
-        SupportedModels.Prophet: ProphetOperatorModel,
-        SupportedModels.Arima: ArimaOperatorModel,
-        SupportedModels.NeuralProphet: NeuralProphetOperatorModel,
-        SupportedModels.LGBForecast: MLForecastOperatorModel,
-        SupportedModels.AutoMLX: AutoMLXOperatorModel,
-        SupportedModels.AutoTS: AutoTSOperatorModel
+        SupportedModels.Prophet: "prophet.ProphetOperatorModel",
+        SupportedModels.Arima: "arima.ArimaOperatorModel",
+        SupportedModels.NeuralProphet: "neuralprophet.NeuralProphetOperatorModel",
+        SupportedModels.LGBForecast: "ml_forecast.MLForecastOperatorModel",
+        SupportedModels.AutoMLX: "automlx.AutoMLXOperatorModel",
+        SupportedModels.AutoTS: "autots.AutoTSOperatorModel"
     }
 
+    @classmethod
+    def _get_model_class(cls, model_type: str) -> type:
+        """Imports and returns the operator model class for the given model type."""
+        module_name, class_name = cls._MAP[model_type].rsplit(".", 1)
+        module = importlib.import_module(f".{module_name}", package=__package__)
+        return getattr(module, class_name)
+
     @classmethod
     def get_model(
         cls, operator_config: ForecastOperatorConfig, datasets: ForecastDatasets
@@ -68,7 +73,9 @@ class ForecastOperatorModelFactory:
             operator_config.spec.model_kwargs = dict()
         if model_type not in cls._MAP:
             raise UnSupportedModelError(model_type)
-        return cls._MAP[model_type](config=operator_config, datasets=datasets)
+        return cls._get_model_class(model_type)(
+            config=operator_config, datasets=datasets
+        )
 
     @classmethod
     def auto_select_model(
@@ -36,7 +36,11 @@ class HistoricalData(AbstractData):
 
     def _ingest_data(self, spec):
         try:
-            self.freq = get_frequency_of_datetime(self.data.index.get_level_values(0))
+            # the unique dates are taken from the index level codes,
+            # rather than by hashing the dates of every row
+            self.freq = get_frequency_of_datetime(
+                self.data.index.unique(level=0), ignore_duplicates=False
+            )
         except TypeError as e:
             logger.warn(
                 f"Error determining frequency: {e.args}. Setting Frequency to None"
@@ -197,13 +201,23 @@ class ForecastDatasets:
         return total_dict
 
     def get_data_at_series(self, s_id, include_horizon=True):
-        all_data = self.get_data_by_series(include_horizon=include_horizon)
+        # Only the requested series is merged, rather than building the whole
+        # `get_data_by_series` dictionary for a single lookup.
+        hist_data = self.historical_data.get_dict_by_series()
+        add_data = self.additional_data.get_dict_by_series()
         try:
-            return all_data[s_id]
-        except:
+            hist_data_i = hist_data[s_id]
+            add_data_i = add_data[s_id]
+        except KeyError:
             raise InvalidParameterError(
                 f"Unable to retrieve series id: {s_id} from data. Available series ids are: {self.list_series_ids()}"
             )
+        return pd.merge(
+            hist_data_i,
+            add_data_i,
+            how="outer" if include_horizon else "left",
+            on=[self._datetime_column_name],
+        )
 
     def get_horizon_at_series(self, s_id):
         return self.get_data_at_series(s_id)[-self._horizon :]
@@ -4,6 +4,8 @@
 # Copyright (c) 2023, 2024 Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
+import logging
+
 import numpy as np
 import optuna
 import pandas as pd
@@ -162,8 +164,9 @@ class NeuralProphetOperatorModel(ForecastOperatorBaseModel):
             future["y"] = None
 
             forecast = model.predict(future)
-            logger.debug(f"-----------------Model {i}----------------------")
-            logger.debug(forecast.tail())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"-----------------Model {i}----------------------")
+                logger.debug(forecast.tail())
 
             # TODO; could also extract trend and seasonality?
             cols_to_read = filter(
@@ -99,12 +99,13 @@ class ProphetOperatorModel(ForecastOperatorBaseModel):
 
             # Make Prediction
             forecast = model.predict(future)
-            logger.debug(f"-----------------Model {i}----------------------")
-            logger.debug(
-                forecast[
-                    [PROPHET_INTERNAL_DATE_COL, "yhat", "yhat_lower", "yhat_upper"]
-                ].tail()
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"-----------------Model {i}----------------------")
+                logger.debug(
+                    forecast[
+                        [PROPHET_INTERNAL_DATE_COL, "yhat", "yhat_lower", "yhat_upper"]
+                    ].tail()
+                )
 
             self.outputs[series_id] = forecast
             self.forecast_output.populate_series_output(
@@ -127,14 +127,25 @@ class ForecastOperatorSpec(DataClassSerializable):
             else False
         )
         self.report_theme = self.report_theme or "light"
-        self.metrics_filename = self.metrics_filename or "metrics.csv"
-        self.test_metrics_filename = self.test_metrics_filename or "test_metrics.csv"
-        self.forecast_filename = self.forecast_filename or "forecast.csv"
+        # The forecast, metrics and explanations files are written as parquet
+        # when requested in the output directory, and as csv otherwise.
+        self.output_format = (
+            "parquet" if self.output_directory.format == "parquet" else "csv"
+        )
+        self.metrics_filename = self.metrics_filename or f"metrics.{self.output_format}"
+        self.test_metrics_filename = (
+            self.test_metrics_filename or f"test_metrics.{self.output_format}"
+        )
+        self.forecast_filename = (
+            self.forecast_filename or f"forecast.{self.output_format}"
+        )
         self.global_explanation_filename = (
-            self.global_explanation_filename or "global_explanation.csv"
+            self.global_explanation_filename
+            or f"global_explanation.{self.output_format}"
         )
         self.local_explanation_filename = (
-            self.local_explanation_filename or "local_explanation.csv"
+            self.local_explanation_filename
+            or f"local_explanation.{self.output_format}"
         )
         self.target_column = self.target_column or "Sales"
         self.errors_dict_filename = "errors.json"
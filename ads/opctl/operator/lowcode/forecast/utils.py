@@ -5,20 +5,13 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
 import os
-import sys
-from typing import List
 
 import fsspec
 import numpy as np
 import pandas as pd
 import cloudpickle
-import plotly.express as px
 from plotly import graph_objects as go
-from sklearn.metrics import (
-    explained_variance_score,
-    mean_absolute_percentage_error,
-    mean_squared_error,
-)
+from sklearn.metrics import mean_absolute_percentage_error
 try:
     from scipy.stats import linregress
 except:
@@ -28,10 +21,7 @@ from ads.common.object_storage_details import ObjectStorageDetails
 from ads.dataset.label_encoder import DataFrameLabelEncoder
 from ads.opctl import logger
 
-from .const import SupportedMetrics, SupportedModels, RENDER_LIMIT
-from .errors import ForecastInputDataError, ForecastSchemaYamlError
-from .operator_config import ForecastOperatorSpec, ForecastOperatorConfig
-from ads.opctl.operator.lowcode.common.utils import merge_category_columns
+from .const import SupportedMetrics, RENDER_LIMIT
 from ads.opctl.operator.lowcode.forecast.const import ForecastOutputColumns
 import report_creator as rc
 
@@ -126,16 +116,23 @@ def _build_metrics_per_horizon(
     totals = test_df.sum(numeric_only=True)
     wmape_weights = np.array((totals / totals.sum()).values)
 
-    metrics_df = pd.DataFrame()
+    # the values of every date are split out in a single pass,
+    # rather than scanning the whole frame once per date
+    y_true_by_date = dict(
+        list(test_df[test_data.target_name].groupby(level=ForecastOutputColumns.DATE))
+    )
+    y_pred_by_date = dict(
+        list(
+            forecast_df[ForecastOutputColumns.FORECAST_VALUE].groupby(
+                level=ForecastOutputColumns.DATE
+            )
+        )
+    )
+
+    metrics = {}
     for date in dates:
-        y_true = test_df.xs(date, level=ForecastOutputColumns.DATE)[
-            test_data.target_name
-        ]
-        y_pred = forecast_df.xs(date, level=ForecastOutputColumns.DATE)[
-            ForecastOutputColumns.FORECAST_VALUE
-        ]
-        y_true = np.array(y_true.values)
-        y_pred = np.array(y_pred.values)
+        y_true = np.array(y_true_by_date[date].values)
+        y_pred = np.array(y_pred_by_date[date].values)
 
         drop_na_mask = ~np.isnan(y_true) & ~np.isnan(y_pred)
         if not drop_na_mask.all():  # There is a missing value
@@ -153,23 +150,15 @@ def _build_metrics_per_horizon(
         mapes = mean_absolute_percentage_error(y_true=y_true, y_pred=y_pred)
         wmapes = mapes * wmape_weights
 
-        metrics_df = pd.concat(
-            [
-                metrics_df,
-                pd.DataFrame(
-                    {
-                        SupportedMetrics.MEAN_SMAPE: np.mean(smapes),
-                        SupportedMetrics.MEDIAN_SMAPE: np.median(smapes),
-                        SupportedMetrics.MEAN_MAPE: np.mean(mapes),
-                        SupportedMetrics.MEDIAN_MAPE: np.median(mapes),
-                        SupportedMetrics.MEAN_WMAPE: np.mean(wmapes),
-                        SupportedMetrics.MEDIAN_WMAPE: np.median(wmapes),
-                    },
-                    index=[date],
-                ),
-            ]
-        )
-    return metrics_df
+        metrics[date] = {
+            SupportedMetrics.MEAN_SMAPE: np.mean(smapes),
+            SupportedMetrics.MEDIAN_SMAPE: np.median(smapes),
+            SupportedMetrics.MEAN_MAPE: np.mean(mapes),
+            SupportedMetrics.MEDIAN_MAPE: np.median(mapes),
+            SupportedMetrics.MEAN_WMAPE: np.mean(wmapes),
+            SupportedMetrics.MEDIAN_WMAPE: np.median(wmapes),
+        }
+    return pd.DataFrame.from_dict(metrics, orient="index")
 
 
 def load_pkl(filepath):
@@ -192,20 +181,34 @@ def write_pkl(obj, filename, output_dir, storage_options):
         cloudpickle.dump(obj, f)
 
 
+def _explained_variance(residuals, y_true) -> float:
+    """Explained variance score, matching `sklearn.metrics.explained_variance_score`."""
+    numerator = np.var(residuals)
+    denominator = np.var(y_true)
+    if denominator == 0:
+        return 1.0 if numerator == 0 else 0.0
+    return 1 - numerator / denominator
+
+
 def _build_metrics_df(y_true, y_pred, series_id):
     if len(y_true) == 0 or len(y_pred) == 0:
         return pd.DataFrame()
+    y_true = np.asarray(y_true, dtype=np.float64)
+    y_pred = np.asarray(y_pred, dtype=np.float64)
+    # MAPE, RMSE and the explained variance all reduce the same residuals,
+    # so they are computed once instead of inside each sklearn metric.
+    residuals = y_true - y_pred
     metrics = dict()
     metrics["sMAPE"] = smape(actual=y_true, predicted=y_pred)
-    metrics["MAPE"] = mean_absolute_percentage_error(y_true=y_true, y_pred=y_pred)
-    metrics["RMSE"] = np.sqrt(mean_squared_error(y_true=y_true, y_pred=y_pred))
+    metrics["MAPE"] = np.mean(
+        np.abs(residuals) / np.maximum(np.abs(y_true), np.finfo(np.float64).eps)
+    )
+    metrics["RMSE"] = np.sqrt(np.mean(np.square(residuals)))
     try:
         metrics["r2"] = linregress(y_true, y_pred).rvalue ** 2
     except:
         metrics["r2"] = r2_score(y_true=y_true, y_pred=y_pred)
-    metrics["Explained Variance"] = explained_variance_score(
-        y_true=y_true, y_pred=y_pred
-    )
+    metrics["Explained Variance"] = _explained_variance(residuals, y_true)
     return pd.DataFrame.from_dict(metrics, orient="index", columns=[series_id])
 
 
@@ -220,7 +223,7 @@ def evaluate_train_metrics(output, metrics_col_name=None):
             Only passed in if the series column was created artifically.
             When passed in, replaces s_id as the column name in the metrics table
     """
-    total_metrics = pd.DataFrame()
+    metrics_dfs = []
     for s_id in output.list_series_ids():
         try:
             forecast_by_s_id = output.get_forecast(s_id)[
@@ -246,13 +249,14 @@ def evaluate_train_metrics(output, metrics_col_name=None):
                 y_pred=y_pred,
                 series_id=s_id,
             )
-            total_metrics = pd.concat([total_metrics, metrics_df], axis=1)
+            metrics_dfs.append(metrics_df)
         except Exception as e:
             logger.debug(
                 f"Failed to generate training metrics for target_series: {s_id}"
             )
             logger.debug(f"Recieved Error Statement: {e}")
-    return total_metrics
+    # the series metrics are concatenated once, rather than growing the frame per series
+    return pd.concat(metrics_dfs, axis=1) if metrics_dfs else pd.DataFrame()
 
 
 def _select_plot_list(fn, series_ids):
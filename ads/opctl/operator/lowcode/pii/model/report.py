@@ -7,6 +7,7 @@
 
 import os
 import random
+import shutil
 import tempfile
 from dataclasses import dataclass, field
 from typing import Dict, List
@@ -332,13 +333,13 @@ class PIIOperatorReport:
             enable_print()
 
             report_uri = report_uri or self.report_uri
-            with open(report_local_path) as f1:
+            with open(report_local_path, "rb") as f1:
                 with fsspec.open(
                     report_uri,
-                    "w",
+                    "wb",
                     **storage_options,
                 ) as f2:
-                    f2.write(f1.read())
+                    shutil.copyfileobj(f1, f2)
 
     def _build_summary_page(self):
         summary = rc.Block(
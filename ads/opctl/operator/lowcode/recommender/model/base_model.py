@@ -5,6 +5,7 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
 import os
+import shutil
 import tempfile
 import time
 from abc import ABC, abstractmethod
@@ -162,13 +163,13 @@ class RecommenderOperatorBaseModel(ABC):
                     enable_print()
 
                     report_path = os.path.join(unique_output_dir, self.spec.report_filename)
-                    with open(report_local_path) as f1:
+                    with open(report_local_path, "rb") as f1:
                         with fsspec.open(
-                                report_path,
-                                "w",
-                                **storage_options,
+                            report_path,
+                            "wb",
+                            **storage_options,
                         ) as f2:
-                            f2.write(f1.read())
+                            shutil.copyfileobj(f1, f2)
 
         # recommender csv report
         write_data(
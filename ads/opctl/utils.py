@@ -11,13 +11,15 @@ import os
 import subprocess
 import sys
 import shlex
+import time
 import urllib.parse
 from subprocess import Popen, PIPE, STDOUT
-from typing import Union, List, Tuple, Dict
+from typing import Callable, Union, List, Tuple, Dict
 import yaml
 import re
 
 import ads
+from ads.common.auth import create_signer
 from ads.common.oci_client import OCIClientFactory
 from ads.opctl import logger
 from ads.opctl.constants import (
@@ -32,6 +34,41 @@ from ads.common.decorator.runtime_dependency import (
 
 CONTAINER_NETWORK = "CONTAINER_NETWORK"
 
+# How long, in seconds, the memoized auth signers are reused before they are created again,
+# so that the expired security tokens and the changes of the OCI config are picked up.
+SIGNER_CACHE_TTL = 300
+
+
+def ttl_lru_cache(ttl: int, maxsize: int = 16) -> Callable:
+    """Memoizes the function like `functools.lru_cache`, but only for `ttl` seconds.
+
+    The results are cached per time bucket of `ttl` seconds, so that all of them
+    are created again once the bucket changes. Call `cache_clear()` on the
+    decorated function to drop the cached results immediately.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.lru_cache(maxsize=maxsize)
+        def cached(ttl_bucket, *args, **kwargs):
+            return func(*args, **kwargs)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return cached(int(time.time() // ttl), *args, **kwargs)
+
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorator
+
+
+@ttl_lru_cache(ttl=SIGNER_CACHE_TTL)
+def get_signer(auth_type: str, oci_config: str = None, oci_profile: str = None) -> Dict:
+    """Creates the auth signer, memoized per auth type, config location and profile
+    for `SIGNER_CACHE_TTL` seconds. The returned dictionary is shared, and must not be modified.
+    """
+    return create_signer(auth_type, oci_config, oci_profile)
+
 
 def get_service_pack_prefix() -> Dict:
     curr_dir = os.path.dirname(os.path.abspath(__file__))
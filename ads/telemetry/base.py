@@ -32,7 +32,13 @@ class TelemetryBase:
         self.bucket = bucket
         self._namespace = namespace
         self._service_endpoint = None
-        logger.debug(f"Initialized Telemetry. Namespace: {self.namespace}, Bucket: {self.bucket}")
+        # resolving the namespace may call the service, so it is only done for debug logs
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Initialized Telemetry. Namespace: %s, Bucket: %s",
+                self.namespace,
+                self.bucket,
+            )
 
 
     @property
@@ -4,17 +4,122 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
 
+import atexit
 import logging
+import os
+import queue
 import threading
 import urllib.parse
+from concurrent.futures import Future
+from functools import cached_property, lru_cache
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .base import TelemetryBase
 from ads.config import DEBUG_TELEMETRY
 
 
 logger = logging.getLogger(__name__)
 
+TELEMETRY_REQUEST_TIMEOUT = (2, 5)  # (connect, read) seconds
+TELEMETRY_MAX_WORKERS = 4
+TELEMETRY_MAX_QUEUE_SIZE = 256
+
+# Events are sent from a few reused daemon threads rather than a new thread per event.
+# The threads are daemonic, so the pending events never delay the interpreter exit,
+# and the events submitted while the queue is full are dropped.
+_events = queue.Queue(maxsize=TELEMETRY_MAX_QUEUE_SIZE)
+_workers = []
+_workers_lock = threading.Lock()
+
+
+def _send_events() -> None:
+    """Sends the queued events until the interpreter exits."""
+    while True:
+        future, fn, args, kwargs = _events.get()
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+        _events.task_done()
+
+
+def _submit(fn, *args, **kwargs) -> Future:
+    """Queues the call for the telemetry threads, starting them on the first call."""
+    if len(_workers) < TELEMETRY_MAX_WORKERS:
+        with _workers_lock:
+            while len(_workers) < TELEMETRY_MAX_WORKERS:
+                worker = threading.Thread(
+                    target=_send_events,
+                    name=f"ads-telemetry_{len(_workers)}",
+                    daemon=True,
+                )
+                worker.start()
+                _workers.append(worker)
+    future = Future()
+    try:
+        _events.put_nowait((future, fn, args, kwargs))
+    except queue.Full:
+        logger.debug("Telemetry queue is full, the event is dropped.")
+        future.cancel()
+    return future
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _reset_after_fork() -> None:
+    """Drops the telemetry threads, queue and session inherited by a forked child.
+    Only the forking thread exists in the child, so the threads are started again
+    on the first event, and the connections of the parent are never reused."""
+    global _events, _workers, _workers_lock, _session, _session_lock
+    _events = queue.Queue(maxsize=TELEMETRY_MAX_QUEUE_SIZE)
+    _workers = []
+    _workers_lock = threading.Lock()
+    _session = None
+    _session_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _get_session() -> requests.Session:
+    """Returns the HTTP session shared by all telemetry clients.
+
+    Reusing one session keeps the connections to the object storage endpoint
+    alive between events, instead of paying a new TCP/TLS handshake per event.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                session.mount(
+                    "https://",
+                    HTTPAdapter(
+                        pool_connections=4,
+                        pool_maxsize=32,
+                        max_retries=Retry(
+                            total=2,
+                            backoff_factor=0.1,
+                            status_forcelist=[500, 502, 503, 504],
+                        ),
+                    ),
+                )
+                atexit.register(session.close)
+                _session = session
+    return _session
+
+
+@lru_cache(maxsize=256)
+def _urlencode_items(items: tuple) -> str:
+    """Encodes the event attributes, caching the result for repeated events."""
+    return urllib.parse.urlencode(items)
+
 
 class TelemetryClient(TelemetryBase):
     """Represents a telemetry python client providing functions to record an event.
@@ -24,7 +129,7 @@ class TelemetryClient(TelemetryBase):
     record_event(category: str = None, action: str = None, path: str = None, **kwargs) -> None
         Send a head request to generate an event record.
     record_event_async(category: str = None, action: str = None, path: str = None,  **kwargs)
-        Starts thread to send a head request to generate an event record.
+        Queues a head request to generate an event record for the telemetry threads.
 
     Examples
     --------
@@ -40,8 +145,18 @@ class TelemetryClient(TelemetryBase):
 
     @staticmethod
     def _encode_user_agent(**kwargs):
-        message = urllib.parse.urlencode(kwargs)
-        return message
+        if not kwargs:
+            return ""
+        try:
+            return _urlencode_items(tuple(kwargs.items()))
+        except TypeError:
+            # unhashable values can't be cached
+            return urllib.parse.urlencode(kwargs)
+
+    @cached_property
+    def _endpoint_prefix(self) -> str:
+        """The part of the event endpoint shared by all events of this client."""
+        return f"{self.service_endpoint}/n/{self.namespace}/b/{self.bucket}/o/telemetry"
 
     def record_event(
         self, category: str = None, action: str = None, detail: str = None, **kwargs
@@ -69,12 +184,18 @@ class TelemetryClient(TelemetryBase):
                 raise ValueError("Please specify the category and the action.")
             if detail:
                 category, action = f"{category}/{action}", detail
-            endpoint = f"{self.service_endpoint}/n/{self.namespace}/b/{self.bucket}/o/telemetry/{category}/{action}"
+            endpoint = f"{self._endpoint_prefix}/{category}/{action}"
             headers = {"User-Agent": self._encode_user_agent(**kwargs)}
-            logger.debug(f"Sending telemetry to endpoint: {endpoint}")
+            logger.debug("Sending telemetry to endpoint: %s", endpoint)
             signer = self._auth["signer"]
-            response = requests.head(endpoint, auth=signer, headers=headers)
-            logger.debug(f"Telemetry status code: {response.status_code}")
+            response = _get_session().head(
+                endpoint,
+                auth=signer,
+                headers=headers,
+                timeout=TELEMETRY_REQUEST_TIMEOUT,
+                allow_redirects=False,
+            )
+            logger.debug("Telemetry status code: %s", response.status_code)
             return response
         except Exception as e:
             if DEBUG_TELEMETRY:
@@ -94,12 +215,8 @@ class TelemetryClient(TelemetryBase):
 
         Returns
         -------
-        Thread
-            A started thread to send a head request to generate an event record.
+        Future
+            A future of the head request sent to generate an event record.
+            The future is cancelled if the event is dropped.
         """
-        thread = threading.Thread(
-            target=self.record_event, args=(category, action, detail), kwargs=kwargs
-        )
-        thread.daemon = True
-        thread.start()
-        return thread
+        return _submit(self.record_event, category, action, detail, **kwargs)
@@ -28,21 +28,27 @@ extensions = [
     "sphinx.ext.doctest",
     "sphinx.ext.mathjax",
     "sphinx.ext.ifconfig",
-    "sphinx.ext.autodoc",
     "sphinx.ext.todo",
     "sphinx.ext.extlinks",
-    "sphinx.ext.intersphinx",    
-    "sphinx.ext.graphviz",
+    "sphinx.ext.intersphinx",
     "nbsphinx",
     "sphinx_code_tabs",
     "sphinx_copybutton",
     "sphinx.ext.duration",
     "sphinx.ext.autosummary",
-    "sphinx.ext.intersphinx",
     "sphinx.ext.viewcode",
     "sphinx_autorun",
 ]
 
+# Graphviz diagrams are only rendered when explicitly requested, since they
+# shell out to the `dot` binary and slow down the regular docs build.
+if os.environ.get("ADS_DOCS_FULL"):
+    extensions += ["sphinx.ext.graphviz", "sphinx.ext.inheritance_diagram"]
+
+# The notebooks are rendered with their stored outputs and never executed
+# during the docs build.
+nbsphinx_execute = "never"
+
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ["_templates"]
 
@@ -21,6 +21,7 @@ from ads.opctl.operator.cmd import run
 from ads.opctl.operator.lowcode.common.utils import (
     get_frequency_of_datetime,
     get_frequency_in_seconds,
+    merge_category_columns,
 )
 
 
@@ -56,3 +57,18 @@ def test_frequency_heplers():
         #     == to_offset(pd.Timedelta(f"{step_size}{unit}")).freqstr
         # )
         assert get_frequency_in_seconds(dt_col) == delta.total_seconds()
+
+
+def test_merge_category_columns():
+    data = pd.DataFrame({"id": [1, 2], "store": ["a", "b"], "y": [1.5, 2.5]})
+    expected = data.apply(
+        lambda x: "__".join([str(x[col]) for col in ["id", "store"]]), axis=1
+    )
+    pd.testing.assert_series_equal(
+        merge_category_columns(data, ["id", "store"]), expected
+    )
+
+    # the integer ids are upcast together with the float columns
+    data = pd.DataFrame({"id": [1, 2], "y": [1.5, 2.5]})
+    assert merge_category_columns(data, ["id"]).tolist() == ["1.0", "2.0"]
+    assert merge_category_columns(data.iloc[:0], ["id"]).empty
@@ -9,6 +9,8 @@ from ads.opctl.operator.lowcode.common.utils import (
 )
 from ads.opctl.operator.common.operator_config import InputData
 from unittest.mock import patch, Mock, MagicMock
+import os
+import tempfile
 import unittest
 import pandas as pd
 
@@ -101,3 +103,18 @@ class TestDataLoad(unittest.TestCase):
                     load_data(self.data_spec)
 
         assert str(e.value) == db_connect_err_msg , f"Expected exception message '{db_connect_err_msg }', but got '{str(e)}'"
+
+    def testLoadCsvKeepsRawColumns(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filename = os.path.join(tmp_dir, "data.csv")
+            pd.DataFrame(
+                {"ds": ["2020-05-03", "2020-06-03"], "y": [1.0, 2.0]}
+            ).to_csv(filename, index=False)
+            self.data_spec.url = filename
+            self.data_spec.connect_args = None
+            self.data_spec.vault_secret_id = None
+
+            data = load_data(self.data_spec, raw_columns=["ds"])
+
+        assert data["ds"].tolist() == ["2020-05-03", "2020-06-03"]
+        assert data["y"].tolist() == [1.0, 2.0]
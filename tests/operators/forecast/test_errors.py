@@ -27,7 +27,7 @@ from ads.opctl.operator.lowcode.forecast.errors import (
     ForecastInputDataError,
 )
 
-from ads.opctl.operator.lowcode.forecast.utils import smape
+from ads.opctl.operator.lowcode.forecast.utils import smape, _build_metrics_df
 from ads.opctl.operator.cmd import run
 import os
 import json
@@ -709,6 +709,25 @@ def test_smape_error():
     assert result == 0
 
 
+def test_build_metrics_df_matches_sklearn():
+    from sklearn.metrics import (
+        explained_variance_score,
+        mean_absolute_percentage_error,
+        mean_squared_error,
+    )
+
+    y_true = np.array([3.0, 0.0, 2.5, 7.0, 4.2])
+    y_pred = np.array([2.5, 0.1, 2.0, 8.0, 4.0])
+    metrics = _build_metrics_df(y_true=y_true, y_pred=y_pred, series_id="s")["s"]
+    assert math.isclose(
+        metrics["MAPE"], mean_absolute_percentage_error(y_true, y_pred)
+    )
+    assert math.isclose(metrics["RMSE"], np.sqrt(mean_squared_error(y_true, y_pred)))
+    assert math.isclose(
+        metrics["Explained Variance"], explained_variance_score(y_true, y_pred)
+    )
+
+
 @pytest.mark.parametrize("model", MODELS)
 def test_date_format(operator_setup, model):
     tmpdirname = operator_setup
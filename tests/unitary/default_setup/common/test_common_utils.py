@@ -10,6 +10,7 @@ import shutil
 import sys
 import tempfile
 from datetime import datetime
+from io import BytesIO
 from unittest.mock import MagicMock, patch, ANY
 
 import numpy as np
@@ -23,6 +24,8 @@ from ads.common import utils
 from ads.common.auth import AuthState, AuthType
 from ads.common.utils import (
     JsonConverter,
+    _copy_local_file,
+    _probe_chunk_size,
     copy_file,
     copy_from_uri,
     extract_region,
@@ -368,6 +371,16 @@ class TestCommonUtils:
                 },
                 "1.txt",
             ),
+            (
+                {
+                    "uri_src": "test_files/archive/1.txt",
+                    "uri_dst": "1.txt",
+                    "force_overwrite": True,
+                    "auth": DEFAULT_SIGNER_CONF,
+                    "chunk_size": "auto",
+                },
+                "1.txt",
+            ),
         ],
     )
     @patch("ads.common.auth.default_signer")
@@ -390,6 +403,51 @@ class TestCommonUtils:
             assert result_file_name.endswith(expected_result)
             assert os.path.exists(result_file_name)
 
+    @pytest.mark.parametrize("copy_file_range", ["native", "error", "missing"])
+    def test_copy_local_file(self, copy_file_range, monkeypatch):
+        """Tests copying a local file with and without `os.copy_file_range`."""
+        if copy_file_range == "error":
+            monkeypatch.setattr(
+                os,
+                "copy_file_range",
+                MagicMock(side_effect=OSError("Operation not supported")),
+                raising=False,
+            )
+        elif copy_file_range == "missing":
+            monkeypatch.delattr(os, "copy_file_range", raising=False)
+
+        data = os.urandom(100_000)
+        with tempfile.TemporaryDirectory() as temp_dir:
+            src = os.path.join(temp_dir, "src.bin")
+            dst = os.path.join(temp_dir, "dst/dst.bin")
+            with open(src, "wb") as f:
+                f.write(data)
+
+            _copy_local_file(src, dst, chunk_size=4096)
+
+            with open(dst, "rb") as f:
+                assert f.read() == data
+
+    @pytest.mark.parametrize(
+        "data, expected_probed_all",
+        [
+            (bytes(range(28)), True),
+            (bytes(range(40)), True),
+            (bytes(range(10)), False),
+            (b"", False),
+        ],
+    )
+    @patch("ads.common.utils.AUTO_CHUNK_SIZE_PROBES", ((1, 4), (2, 8), (4, 16)))
+    def test_probe_chunk_size(self, data, expected_probed_all):
+        """Tests probing the chunk sizes while copying the beginning of the file."""
+        fread, fwrite = BytesIO(data), BytesIO()
+        chunk_size, probed_all = _probe_chunk_size(fread, fwrite)
+
+        assert chunk_size in (1, 2, 4)
+        assert probed_all == expected_probed_all
+        assert fwrite.getvalue() == data[:28]
+        assert fread.read() == data[28:]
+
     @patch("ads.common.auth.default_signer")
     def test_remove_file_fail(self, mock_default_signer):
         """Ensures removing file fails in case of incorrect input parameters."""
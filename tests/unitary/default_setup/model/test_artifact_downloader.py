@@ -8,12 +8,17 @@ import os
 import shutil
 import tempfile
 import json
+from concurrent.futures.process import BrokenProcessPool
 from unittest.mock import MagicMock, patch
+from zipfile import ZIP_DEFLATED, ZipFile
 
 import pytest
 from ads.model.artifact_downloader import (
+    ZIP_TAIL_SIZE,
     LargeArtifactDownloader,
     SmallArtifactDownloader,
+    _parallel_extractall,
+    _pipelined_download_extractall,
 )
 
 MODEL_OCID = "ocid1.datasciencemodel.oc1.xxx"
@@ -37,7 +42,7 @@ class TestArtifactDownloader:
     def setup_method(self):
         self.mock_dsc_model = MagicMock(
             get_artifact_info=MagicMock(),
-            get_model_artifact_content=MagicMock(),
+            stream_artifact_to=MagicMock(),
             import_model_artifact=MagicMock(),
             id=MODEL_OCID,
         )
@@ -102,8 +107,8 @@ class TestArtifactDownloader:
         self.mock_dsc_model.get_artifact_info.return_value = {
             "Content-Disposition": "attachment; filename=artifact.zip",
         }
-        self.mock_dsc_model.get_model_artifact_content.return_value = (
-            expected_artifact_bytes_content
+        self.mock_dsc_model.stream_artifact_to.side_effect = (
+            lambda fileobj: fileobj.write(expected_artifact_bytes_content)
         )
         with tempfile.TemporaryDirectory() as tmp_dir:
             SmallArtifactDownloader(
@@ -112,7 +117,7 @@ class TestArtifactDownloader:
                 force_overwrite=True,
             ).download()
 
-            self.mock_dsc_model.get_model_artifact_content.assert_called()
+            self.mock_dsc_model.stream_artifact_to.assert_called()
 
             test_files = list(glob.iglob(os.path.join(tmp_dir, "**"), recursive=True))
             expected_files = [
@@ -164,8 +169,8 @@ class TestArtifactDownloader:
         self.mock_dsc_model.get_artifact_info.return_value = {
             "Content-Disposition": "attachment; filename=artifact.json",
         }
-        self.mock_dsc_model.get_model_artifact_content.return_value = (
-            expected_artifact_bytes_content
+        self.mock_dsc_model.stream_artifact_to.side_effect = (
+            lambda fileobj: fileobj.write(expected_artifact_bytes_content)
         )
         with tempfile.TemporaryDirectory() as tmp_dir:
             SmallArtifactDownloader(
@@ -173,7 +178,7 @@ class TestArtifactDownloader:
                 target_dir=tmp_dir,
                 force_overwrite=True,
             ).download()
-            self.mock_dsc_model.get_model_artifact_content.assert_called()
+            self.mock_dsc_model.stream_artifact_to.assert_called()
 
             test_files = list(glob.iglob(os.path.join(tmp_dir, "**"), recursive=True))
             expected_files = [
@@ -214,3 +219,158 @@ class TestArtifactDownloader:
             ).download()
 
             mock_download.assert_called()
+
+    @patch.dict(os.environ, {"ADS_DOWNLOAD_ENGINE": "async"})
+    @patch(
+        "ads.common.object_storage_details.ObjectStorageDetails.bulk_download_from_object_storage_async"
+    )
+    @patch(
+        "ads.common.object_storage_details.ObjectStorageDetails.bulk_download_from_object_storage"
+    )
+    def test_download_large_artifact_from_model_file_description_async(
+        self, mock_download, mock_download_async
+    ):
+        """Tests that the async download engine can be selected with the env variable."""
+        self.mock_dsc_model.is_model_by_reference.return_value = True
+        with open(
+            os.path.join(self.curr_dir, "test_files/model_description.json"), "r"
+        ) as file_data:
+            model_file_description = json.load(file_data)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            LargeArtifactDownloader(
+                dsc_model=self.mock_dsc_model,
+                target_dir=os.path.join(tmp_dir, "model_artifacts/"),
+                force_overwrite=True,
+                region=self.mock_region,
+                auth=self.mock_auth,
+                model_file_description=model_file_description,
+            ).download()
+
+            mock_download_async.assert_called()
+            mock_download.assert_not_called()
+
+    def test_parallel_extractall(self):
+        """Tests extracting nested members and sanitizing unsafe member names."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            zip_file_path = os.path.join(tmp_dir, "artifact.zip")
+            with ZipFile(zip_file_path, "w") as zip_file:
+                zip_file.writestr("score.py", "score")
+                zip_file.writestr("empty_dir/", "")
+                zip_file.writestr("a/b/c/model.pkl", "model")
+                zip_file.writestr("../outside.txt", "outside")
+
+            target_dir = os.path.join(tmp_dir, "target")
+            _parallel_extractall(zip_file_path, target_dir)
+
+            with open(os.path.join(target_dir, "a/b/c/model.pkl")) as f:
+                assert f.read() == "model"
+            assert os.path.isfile(os.path.join(target_dir, "score.py"))
+            assert os.path.isdir(os.path.join(target_dir, "empty_dir"))
+            assert os.path.isfile(os.path.join(target_dir, "outside.txt"))
+            assert not os.path.exists(os.path.join(tmp_dir, "outside.txt"))
+
+    @pytest.mark.parametrize("mode", ["thread", "process"])
+    def test_parallel_extractall_mode(self, mode):
+        """Tests extracting the archive in a thread pool and in a process pool."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            zip_file_path = os.path.join(tmp_dir, "artifact.zip")
+            with ZipFile(zip_file_path, "w", compression=ZIP_DEFLATED) as zip_file:
+                for i in range(5):
+                    zip_file.writestr(f"dir_{i % 2}/file_{i}.txt", str(i) * 1000)
+
+            target_dir = os.path.join(tmp_dir, "target")
+            _parallel_extractall(zip_file_path, target_dir, mode=mode)
+
+            for i in range(5):
+                with open(os.path.join(target_dir, f"dir_{i % 2}/file_{i}.txt")) as f:
+                    assert f.read() == str(i) * 1000
+
+    @patch(
+        "ads.model.artifact_downloader._process_extractall",
+        side_effect=BrokenProcessPool("A child process terminated abruptly."),
+    )
+    def test_parallel_extractall_process_fallback(self, mock_process_extractall):
+        """Tests falling back to the threads when the worker processes fail to start."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            zip_file_path = os.path.join(tmp_dir, "artifact.zip")
+            with ZipFile(zip_file_path, "w", compression=ZIP_DEFLATED) as zip_file:
+                zip_file.writestr("score.py", "score")
+
+            target_dir = os.path.join(tmp_dir, "target")
+            _parallel_extractall(zip_file_path, target_dir, mode="process")
+
+            mock_process_extractall.assert_called_once()
+            with open(os.path.join(target_dir, "score.py")) as f:
+                assert f.read() == "score"
+
+    def test_pipelined_download_extractall(self):
+        """Tests overlapping the archive download with the extraction."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            uri_src = os.path.join(tmp_dir, "artifact.zip")
+            with ZipFile(uri_src, "w") as zip_file:
+                zip_file.writestr("score.py", "score")
+                zip_file.writestr("a/b/model.pkl", "model" * 100)
+
+            zip_file_path = os.path.join(tmp_dir, "download.zip")
+            target_dir = os.path.join(tmp_dir, "target")
+            assert _pipelined_download_extractall(
+                uri_src=uri_src,
+                zip_file_path=zip_file_path,
+                target_dir=target_dir,
+                chunk_size=16,
+            )
+
+            with open(os.path.join(target_dir, "a/b/model.pkl")) as f:
+                assert f.read() == "model" * 100
+            with open(uri_src, "rb") as src, open(zip_file_path, "rb") as dst:
+                assert src.read() == dst.read()
+
+    def test_pipelined_download_extractall_many_members(self):
+        """Tests extracting many small members downloaded in small chunks."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            uri_src = os.path.join(tmp_dir, "artifact.zip")
+            with ZipFile(uri_src, "w") as zip_file:
+                for i in range(300):
+                    zip_file.writestr(f"dir_{i % 7}/file_{i}.txt", f"content_{i}" * 20)
+
+            zip_file_path = os.path.join(tmp_dir, "download.zip")
+            target_dir = os.path.join(tmp_dir, "target")
+            assert _pipelined_download_extractall(
+                uri_src=uri_src,
+                zip_file_path=zip_file_path,
+                target_dir=target_dir,
+                chunk_size=4096,
+            )
+
+            for i in range(300):
+                with open(os.path.join(target_dir, f"dir_{i % 7}/file_{i}.txt")) as f:
+                    assert f.read() == f"content_{i}" * 20
+
+    def test_pipelined_download_extractall_large_central_directory(self):
+        """Tests pipelining the archive with the central directory larger than the fetched tail."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            uri_src = os.path.join(tmp_dir, "artifact.zip")
+            with ZipFile(uri_src, "w") as zip_file:
+                for i in range(2000):
+                    zip_file.writestr(f"some/nested/directory/file_{i}.txt", str(i))
+            with ZipFile(uri_src) as zip_file:
+                assert os.path.getsize(uri_src) - zip_file.start_dir > ZIP_TAIL_SIZE
+
+            zip_file_path = os.path.join(tmp_dir, "download.zip")
+            target_dir = os.path.join(tmp_dir, "target")
+            on_extract = MagicMock()
+            assert _pipelined_download_extractall(
+                uri_src=uri_src,
+                zip_file_path=zip_file_path,
+                target_dir=target_dir,
+                chunk_size=1 << 16,
+                on_extract=on_extract,
+            )
+
+            on_extract.assert_called_once()
+            for i in range(2000):
+                with open(
+                    os.path.join(target_dir, f"some/nested/directory/file_{i}.txt")
+                ) as f:
+                    assert f.read() == str(i)
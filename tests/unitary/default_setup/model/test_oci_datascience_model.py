@@ -3,6 +3,7 @@
 # Copyright (c) 2022, 2024 Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
+from io import BytesIO
 from unittest.mock import MagicMock, patch, call, PropertyMock
 
 import pytest
@@ -330,6 +331,17 @@ class TestOCIDataScienceModel:
             )
             assert test_result == b"test"
 
+    @patch.object(OCIDataScienceModel, "client")
+    def test_stream_artifact_to(self, mock_client):
+        """Tests streaming model artifact content into the file object."""
+        mock_client.get_model_artifact_content = MagicMock(
+            return_value=MagicMock(data=MagicMock(raw=BytesIO(b"test")))
+        )
+        fileobj = BytesIO()
+        self.mock_model.stream_artifact_to(fileobj)
+        mock_client.get_model_artifact_content.assert_called_with(model_id=MODEL_OCID)
+        assert fileobj.getvalue() == b"test"
+
     @patch.object(OCIDataScienceModel, "client")
     def test_get_model_artifact_content_fail(self, mock_client):
         """Tests getting model artifact content."""
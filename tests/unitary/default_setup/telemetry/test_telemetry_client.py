@@ -4,8 +4,10 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
 
+import queue
 from unittest.mock import patch, PropertyMock
 
+from ads.telemetry import client
 from ads.telemetry.client import TelemetryClient
 
 class TestTelemetryClient:
@@ -20,7 +22,7 @@ class TestTelemetryClient:
 
         return MockResponse(200)
 
-    @patch('requests.head', side_effect=mocked_requests_head)
+    @patch('requests.Session.head', side_effect=mocked_requests_head)
     @patch('ads.telemetry.client.TelemetryClient.service_endpoint', new_callable=PropertyMock,
            return_value=endpoint)
     def test_telemetry_client_record_event(self, mock_endpoint, mock_head):
@@ -57,3 +59,44 @@ class TestTelemetryClient:
             assert all(endpoint == expected_endpoint for endpoint in args)
             assert kwargs['headers'] == expected_headers[i]
             i += 1
+
+    @patch('requests.Session.head', side_effect=mocked_requests_head)
+    @patch('ads.telemetry.client.TelemetryClient.service_endpoint', new_callable=PropertyMock,
+           return_value=endpoint)
+    def test_telemetry_client_record_event_async(self, mock_endpoint, mock_head):
+        """Tests TelemetryClient.record_event_async() sends the event from the daemon threads."""
+        telemetry = TelemetryClient(bucket="test_bucket", namespace="test_namespace")
+        future = telemetry.record_event_async(category="aqua/service/model", action="list")
+        response = future.result(timeout=10)
+
+        assert response.status_code == 200
+        mock_head.assert_called_once()
+        assert all(worker.daemon for worker in client._workers)
+
+    @patch('requests.Session.head', side_effect=mocked_requests_head)
+    @patch('ads.telemetry.client._events.put_nowait', side_effect=queue.Full)
+    def test_telemetry_client_record_event_async_queue_full(self, mock_put, mock_head):
+        """Tests TelemetryClient.record_event_async() drops the event when the queue is full."""
+        telemetry = TelemetryClient(bucket="test_bucket", namespace="test_namespace")
+        future = telemetry.record_event_async(category="aqua/service/model", action="list")
+
+        assert future.cancelled()
+        mock_head.assert_not_called()
+
+    @patch('requests.Session.head', side_effect=mocked_requests_head)
+    @patch('ads.telemetry.client.TelemetryClient.service_endpoint', new_callable=PropertyMock,
+           return_value=endpoint)
+    def test_telemetry_client_record_event_async_after_fork(self, mock_endpoint, mock_head):
+        """Tests the events are sent once the telemetry state is reset in a forked child."""
+        telemetry = TelemetryClient(bucket="test_bucket", namespace="test_namespace")
+        telemetry.record_event_async(category="aqua/service/model", action="list").result(timeout=10)
+
+        with patch.object(client, "_events", client._events), \
+                patch.object(client, "_workers", client._workers), \
+                patch.object(client, "_workers_lock", client._workers_lock), \
+                patch.object(client, "_session", client._session), \
+                patch.object(client, "_session_lock", client._session_lock):
+            client._reset_after_fork()
+            assert client._workers == []
+            future = telemetry.record_event_async(category="aqua/service/model", action="list")
+            assert future.result(timeout=10).status_code == 200
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+
+# Copyright (c) 2024 Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
+
+import gzip
+import os
+import tempfile
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from ads.common.object_storage_details import ObjectStorageDetails
+
+ENDPOINT = "https://objectstorage.us-ashburn-1.oraclecloud.com"
+GZIP_ENCODED_DATA = gzip.compress(b"a,b\n1,2\n" * 1000)
+
+OBJECTS = {
+    f"{ENDPOINT}/n/test_namespace/b/test_bucket/o/model%2Fscore.py": b"score",
+    f"{ENDPOINT}/n/test_namespace/b/test_bucket/o/model%2Fmodel.pkl?versionId=v1": b"model"
+    * 1000,
+    f"{ENDPOINT}/n/test_namespace/b/test_bucket/o/model%2Fdata.csv": GZIP_ENCODED_DATA,
+}
+
+
+def mock_signer(request):
+    request.headers["authorization"] = f"Signature {request.url}"
+
+
+class MockContent:
+    def __init__(self, data):
+        self.data = data
+
+    async def iter_chunked(self, size):
+        for i in range(0, len(self.data), size):
+            yield self.data[i : i + size]
+
+
+class MockResponse:
+    def __init__(self, data):
+        self.content = MockContent(data)
+
+    def raise_for_status(self):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class MockClientSession:
+    requests = []
+    kwargs = {}
+
+    def __init__(self, *args, **kwargs):
+        MockClientSession.kwargs = kwargs
+
+    def get(self, url, headers=None):
+        self.requests.append((str(url), headers))
+        return MockResponse(OBJECTS[str(url)])
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class TestObjectStorageAsyncDownload:
+    @patch("aiohttp.TCPConnector")
+    @patch("aiohttp.ClientSession", new=MockClientSession)
+    @patch.object(ObjectStorageDetails, "os_client", new_callable=PropertyMock)
+    def test_bulk_download_from_object_storage_async(
+        self, mock_os_client, mock_connector
+    ):
+        """Tests the objects are downloaded with the signed requests."""
+        mock_os_client.return_value = MagicMock(
+            base_client=MagicMock(endpoint=ENDPOINT, signer=mock_signer)
+        )
+        MockClientSession.requests = []
+        MockClientSession.kwargs = {}
+        auth = {"config": {}, "signer": MagicMock()}
+        bucket_details = ObjectStorageDetails(
+            bucket="test_bucket", namespace="test_namespace", auth=auth
+        )
+        paths = [
+            ObjectStorageDetails(
+                bucket="test_bucket",
+                namespace="test_namespace",
+                filepath="model/score.py",
+                auth=auth,
+            ),
+            ObjectStorageDetails(
+                bucket="test_bucket",
+                namespace="test_namespace",
+                filepath="model/model.pkl",
+                version="v1",
+                auth=auth,
+            ),
+            ObjectStorageDetails(
+                bucket="test_bucket",
+                namespace="test_namespace",
+                filepath="model/data.csv",
+                auth=auth,
+            ),
+        ]
+
+        with tempfile.TemporaryDirectory() as target_dir:
+            bucket_details.bulk_download_from_object_storage_async(paths, target_dir)
+
+            with open(os.path.join(target_dir, "test_bucket/model/score.py"), "rb") as f:
+                assert f.read() == b"score"
+            with open(os.path.join(target_dir, "test_bucket/model/model.pkl"), "rb") as f:
+                assert f.read() == b"model" * 1000
+            # The gzip encoded object is saved as stored.
+            with open(os.path.join(target_dir, "test_bucket/model/data.csv"), "rb") as f:
+                assert f.read() == GZIP_ENCODED_DATA
+
+        assert MockClientSession.kwargs["auto_decompress"] is False
+        assert sorted(url for url, _ in MockClientSession.requests) == sorted(OBJECTS)
+        for url, headers in MockClientSession.requests:
+            assert headers["authorization"] == f"Signature {url}"
@@ -9,11 +9,19 @@ from unittest.mock import patch
 import pytest
 import yaml
 
-from ads.opctl.backend.ads_ml_job import MLJobBackend
+from ads.opctl.backend.ads_ml_job import (
+    MLJobBackend,
+    _get_data_science_client,
+)
+from ads.opctl.utils import get_signer
 from ads.jobs import Job, DataScienceJobRun
 
 
 class TestMLJobBackend:
+    def setup_method(self):
+        get_signer.cache_clear()
+        _get_data_science_client.cache_clear()
+
     @property
     def curr_dir(self):
         return os.path.dirname(os.path.abspath(__file__))
@@ -127,6 +135,17 @@ class TestMLJobBackend:
         mock_from_ocid.assert_called_with("test_job_run_id")
         mock_watch.assert_called_with(interval=10, wait=15)
 
+    @patch("ads.common.auth.set_auth")
+    def test_auth_context_reentrant(self, mock_set_auth):
+        """Ensures that the auth state is switched only by the outermost context."""
+        backend = MLJobBackend(self.config)
+        with backend._auth_context:
+            with backend._auth_context:
+                pass
+            assert backend._auth_context._depth == 1
+        assert backend._auth_context._depth == 0
+        mock_set_auth.assert_called_once_with(auth="api_key", profile="DEFAULT")
+
     @pytest.mark.parametrize(
         "runtime_type",
         ["container", "script", "python", "notebook", "gitPython"],
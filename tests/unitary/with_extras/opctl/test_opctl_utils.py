@@ -3,6 +3,8 @@
 # Copyright (c) 2021, 2023 Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
+from unittest.mock import MagicMock, patch
+
 import oci
 import pytest
 
@@ -10,6 +12,7 @@ from ads.opctl.constants import DEFAULT_OCI_CONFIG_FILE, DEFAULT_PROFILE
 from ads.opctl.utils import (
     parse_conda_uri,
     get_oci_region,
+    ttl_lru_cache,
 )
 from ads.common.auth import AuthType, create_signer
 
@@ -34,3 +37,18 @@ class TestOpctlUtils:
             DEFAULT_OCI_CONFIG_FILE, DEFAULT_PROFILE
         )
         assert get_oci_region(oci_auth) == config_from_file["region"]
+
+    def test_ttl_lru_cache(self):
+        func = MagicMock(side_effect=lambda *args: object())
+        cached_func = ttl_lru_cache(ttl=300)(func)
+
+        with patch("time.time", return_value=0):
+            result = cached_func("api_key")
+            assert cached_func("api_key") is result
+            assert cached_func("resource_principal") is not result
+        with patch("time.time", return_value=300):
+            assert cached_func("api_key") is not result
+        cached_func.cache_clear()
+        with patch("time.time", return_value=300):
+            cached_func("api_key")
+        assert func.call_count == 4
@@ -14,7 +14,12 @@ import pytest
 import yaml
 
 from ads import jobs
-from ads.opctl.backend.ads_ml_job import MLJobOperatorBackend
+from ads.opctl.backend.ads_ml_job import (
+    MLJobOperatorBackend,
+    _get_data_science_client,
+    _load_operator_info,
+)
+from ads.opctl.utils import get_signer
 from ads.opctl.backend.local import LocalOperatorBackend, OperatorLoader
 from ads.opctl.config.base import ConfigProcessor
 from ads.opctl.config.merger import ConfigMerger
@@ -229,6 +234,8 @@ class TestMLJobOperatorBackend:
         }
 
     def setup_method(self):
+        get_signer.cache_clear()
+        _get_data_science_client.cache_clear()
         self.mock_config = (
             ConfigProcessor(
                 {
@@ -331,7 +338,10 @@ class TestMLJobOperatorBackend:
                         "type": "python",
                         "spec": {
                             "entrypoint": "example_1_run.sh",
-                            "scriptPathURI": temp_dir,
+                            "scriptPathURI": os.path.join(
+                                temp_dir,
+                                f"{os.path.basename(temp_dir.rstrip('/'))}.tar",
+                            ),
                             "workingDir": os.path.basename(temp_dir.rstrip("/")),
                             "env": [
                                 {"name": "OCI_IAM_TYPE", "value": "resource_principal"},
@@ -378,6 +388,7 @@ class TestMLJobOperatorBackend:
         """Test running the operator with success result"""
         self.mock_backend.runtime_config = mock_runtime_config
         self.mock_backend.operator_info = None
+        _load_operator_info.cache_clear()
 
         mock_run_with = MagicMock()
         self.mock_backend._RUNTIME_MAP[mock_runtime_type] = mock_run_with